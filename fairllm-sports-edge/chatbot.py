@@ -6,14 +6,352 @@ Talk to the LLM-powered multi-agent system!
 import sys
 sys.path.insert(0, 'src')
 
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
+import argparse
+import asyncio
+import csv
+import io
+import math
+import re
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+from rich.console import Console, Group
+from rich.prompt import Prompt, Confirm, FloatPrompt
 from rich.panel import Panel
 from rich.markdown import Markdown
+from rich.table import Table
+from rich.text import Text
 from fairllm_agent.agentic_workflow_llm import LLMSportsEdgeFlow
+from fairllm_agent.probability_calc import compute_edge_batch
 
 console = Console()
 
+# Section rules and headers printed every turn, built once instead of re-parsing markup
+_SEP = Text("=" * 70)
+_NEW_ANALYSIS = Text("💬 New Analysis", style="bold magenta")
+_RESULTS = Text("🎯 AI ANALYSIS RESULTS", style="bold")
+
+# Agent list and usage notes shown when the chat starts, built once at import
+_HOW_TO_MD = """\
+**How to use:**
+
+1. Tell me the game (e.g., 'Lakers vs Celtics')
+2. Give me the odds (e.g., 'Lakers -140, Celtics +120')
+3. Share your prediction (e.g., 'I think Lakers have 62% chance')
+4. I'll analyze and recommend!
+
+*Type 'batch' at step 1 to paste a list of games.*
+"""
+
+_INTRO = Group(
+    Panel.fit(
+        "• [cyan]OddsAnalyzer[/cyan] - Removes vig from odds\n"
+        "• [cyan]ForecastEvaluator[/cyan] - Validates predictions\n"
+        "• [cyan]EdgeCalculator[/cyan] - Finds betting edges\n"
+        "• [cyan]ReportGenerator[/cyan] - Makes recommendations",
+        title="Agents",
+        border_style="cyan"
+    ),
+    Markdown(_HOW_TO_MD)
+)
+
+# Input parsing patterns, compiled once
+_ODDS_RE = re.compile(r'[-+]?\d+')
+_VS_RE = re.compile(r'\s+(?:vs|v)\s+', re.IGNORECASE)
+
+# Agents are built and their models loaded on a background thread while the user enters the first game
+_workflow = None
+_workflow_error = None
+
+
+def _init_workflow():
+    global _workflow, _workflow_error
+    try:
+        workflow = LLMSportsEdgeFlow()
+        workflow.warmup()
+        _workflow = workflow
+    except Exception as e:
+        _workflow_error = e
+
+
+_workflow_init = threading.Thread(target=_init_workflow, daemon=True)
+
+
+class _HeldOutput:
+    """sys.stdout stand-in that holds back one thread's prints so they don't land on a prompt"""
+
+    def __init__(self, stream, thread):
+        self._stream = stream
+        self._thread = thread
+        self._held = io.StringIO()
+
+    def write(self, text):
+        if threading.current_thread() is self._thread:
+            return self._held.write(text)
+        return self._stream.write(text)
+
+    def release(self):
+        """Put the real stream back and print what was held"""
+        sys.stdout = self._stream
+        self._stream.write(self._held.getvalue())
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def start_workflow_init():
+    """Start building the agents; their loading messages are shown once a game needs them"""
+    sys.stdout = _HeldOutput(sys.stdout, _workflow_init)
+    _workflow_init.start()
+
+
+def get_workflow() -> LLMSportsEdgeFlow:
+    """Wait for the background initialization (starting it if main() didn't)"""
+    if _workflow_init.ident is None:
+        start_workflow_init()
+    _workflow_init.join()
+    if isinstance(sys.stdout, _HeldOutput):
+        sys.stdout.release()
+    if _workflow is None:
+        raise RuntimeError(f"AI agents failed to initialize: {_workflow_error}")
+    return _workflow
+
+
+# Fields shared by every game entered in the chat
+_ODDS_TEMPLATE = {
+    "sport": "basketball",
+    "league": "NBA",
+    "sportsbook": "User Input"
+}
+
+
+def _whole_pct(prob: float) -> int:
+    """prob as a whole percent, halves rounded up (62.5% -> 63)"""
+    return math.floor(round(prob * 100, 9) + 0.5)
+
+
+@lru_cache(maxsize=256)
+def _cached_run(workflow: LLMSportsEdgeFlow, home_odds: int, away_odds: int,
+                home_pct: int, home_team: str, away_team: str) -> dict:
+    """Run the workflow once per distinct game; repeats are answered from memory.
+    
+    home_pct is the home win % as a whole number (see _whole_pct); it is both the
+    cache key and the prediction analyzed, so what the user is shown matches the report.
+    """
+    odds_data, forecast_data = build_game_data(home_team, away_team, home_odds, away_odds, home_pct / 100)
+    return asyncio.run(stream_analysis(workflow, odds_data, forecast_data))
+
+
+async def stream_analysis(workflow: LLMSportsEdgeFlow, odds_data: dict, forecast_data: dict) -> dict:
+    """Run the workflow, printing each agent's reasoning while it is generated.
+    
+    Agents run concurrently, so text from an agent that isn't on screen yet is
+    buffered and shown once the agents before it have finished.
+    """
+    speakers = [agent.name for agent in workflow.agents[:3]]
+    buffered = {name: [] for name in speakers}
+    finished = set()
+    current = 0
+    report = None
+    started = False
+    
+    async for kind, agent_name, payload in workflow.astream(odds_data, forecast_data):
+        if not started:
+            started = True
+            console.print("[bold cyan]💭 Agent Reasoning:[/bold cyan]\n")
+            console.print(f"[cyan]{speakers[0]} says:[/cyan] ", end="")
+        
+        if kind == "report":
+            report = payload
+        elif agent_name not in buffered:
+            continue
+        elif kind == "text":
+            if agent_name == speakers[current]:
+                console.print(payload, end="", markup=False, highlight=False)
+            else:
+                buffered[agent_name].append(payload)
+        elif kind == "done":
+            finished.add(agent_name)
+            while current < len(speakers) and speakers[current] in finished:
+                current += 1
+                console.print("\n")
+                if current < len(speakers):
+                    console.print(f"[cyan]{speakers[current]} says:[/cyan] ", end="")
+                    console.print("".join(buffered[speakers[current]]), end="", markup=False, highlight=False)
+    
+    return report
+
+
+def build_game_data(home_team: str, away_team: str, home_odds: int, away_odds: int,
+                    home_prob: float) -> tuple[dict, dict]:
+    """Build the (odds_data, forecast_data) pair the workflow expects"""
+    event_id = f"chat-{home_team}-{away_team}"
+    
+    odds_data = _ODDS_TEMPLATE | {
+        "event_id": event_id,
+        "home_team": home_team,
+        "away_team": away_team,
+        "moneyline": {"home": home_odds, "away": away_odds}
+    }
+    
+    forecast_data = {
+        "event_id": event_id,
+        "p_model": {"home": home_prob, "away": 1.0 - home_prob}
+    }
+    
+    return odds_data, forecast_data
+
+
+def parse_game_line(line: str):
+    """Parse 'Team1 vs Team2 | odds1 odds2 | pct' into (home, away, home_odds, away_odds, home_prob)"""
+    parts = line.split('|')
+    if len(parts) != 3:
+        return None
+    
+    teams = _VS_RE.split(parts[0].strip(), maxsplit=1)
+    nums = _ODDS_RE.findall(parts[1])
+    if len(teams) != 2 or len(nums) < 2:
+        return None
+    
+    try:
+        home_prob = float(parts[2].strip().rstrip('%')) / 100
+    except ValueError:
+        return None
+    if not 0 <= home_prob <= 1:
+        return None
+    
+    return teams[0].strip(), teams[1].strip(), int(nums[0]), int(nums[1]), home_prob
+
+
+def batch_analysis(workflow: LLMSportsEdgeFlow):
+    """Analyze a pasted list of games in one workflow call"""
+    console.print("[bold cyan]Paste games, one per line (blank line to finish):[/bold cyan]")
+    console.print("[dim]Format: 'Lakers vs Celtics | -140 +120 | 62'[/dim]")
+    
+    games = []
+    while True:
+        line = console.input("[dim]>[/dim] ").strip()
+        if not line:
+            break
+        parsed = parse_game_line(line)
+        if parsed is None:
+            console.print(f"[yellow]Skipping unreadable line: {line}[/yellow]")
+            continue
+        games.append(parsed)
+    
+    analyze_games(workflow, games)
+
+
+def load_games_file(path: str) -> list:
+    """
+    Read games from a CSV file
+    
+    Expected columns: home_team, away_team, home_odds, away_odds, home_pct
+    (home_pct is the home win chance in percent). Unreadable rows are skipped.
+    """
+    games = []
+    with open(path, newline='') as f:
+        for line_no, row in enumerate(csv.DictReader(f), start=2):
+            try:
+                home_prob = float(row['home_pct'].strip().rstrip('%')) / 100
+                if not 0 <= home_prob <= 1:
+                    raise ValueError(f"home_pct out of range: {row['home_pct']}")
+                games.append((row['home_team'].strip(), row['away_team'].strip(),
+                              int(row['home_odds']), int(row['away_odds']), home_prob))
+            except (KeyError, TypeError, ValueError) as e:
+                console.print(f"[yellow]Skipping line {line_no} of {path}: {e}[/yellow]")
+    return games
+
+
+def analyze_games(workflow: LLMSportsEdgeFlow, games: list):
+    """Show the edge math for a list of parsed games, then the AI recommendations"""
+    if not games:
+        console.print("[yellow]No games to analyze.[/yellow]")
+        return
+    
+    # The math needs no LLM, so show it right away
+    home_teams, away_teams, home_odds, away_odds, home_probs = zip(*games)
+    fair_home, _, edge_home, edge_away = compute_edge_batch(
+        np.array(home_odds, dtype=np.int64), np.array(away_odds, dtype=np.int64), np.array(home_probs)
+    )
+    
+    table = Table(title="📊 The Numbers", show_header=True, header_style="bold cyan")
+    table.add_column("Matchup")
+    table.add_column("Fair (home)", justify="right")
+    table.add_column("Yours (home)", justify="right")
+    table.add_column("Edge home / away", justify="right")
+    
+    for i, (home, away) in enumerate(zip(home_teams, away_teams)):
+        table.add_row(
+            f"{home} vs {away}",
+            f"{fair_home[i]:.1%}",
+            f"{home_probs[i]:.1%}",
+            f"{edge_home[i]:+.2f}% / {edge_away[i]:+.2f}%"
+        )
+    console.print(table)
+    
+    console.print(f"\n[bold yellow]🤖 Running AI analysis on {len(games)} games...[/bold yellow]\n")
+    reports = workflow.run_batch([build_game_data(*game) for game in games])
+    
+    table = Table(title="💰 Recommendations", show_header=True, header_style="bold cyan")
+    table.add_column("Matchup")
+    table.add_column("Recommendation")
+    
+    for report in reports:
+        table.add_row(f"{report['matchup']['home']} vs {report['matchup']['away']}", report['recommendation'])
+    
+    console.print(table)
+
+
+def guided_entry(game_input: str) -> tuple:
+    """Parse the matchup typed at step 1, then ask for the odds and prediction (steps 2-3)"""
+    # Parse teams
+    teams = _VS_RE.split(game_input, maxsplit=1)
+    if len(teams) == 2:
+        home_team = teams[0].strip()
+        away_team = teams[1].strip()
+    else:
+        console.print("[yellow]I'll assume first team is home. Use 'Team1 vs Team2' format next time.[/yellow]")
+        teams = game_input.split()
+        home_team = teams[0] if len(teams) > 0 else "Home"
+        away_team = teams[1] if len(teams) > 1 else "Away"
+    
+    console.print(f"[green]✓ Got it: {home_team} (home) vs {away_team} (away)[/green]\n")
+    
+    # Step 2: Get odds
+    console.print("[bold cyan]Step 2: What are the current odds?[/bold cyan]")
+    console.print("[dim]Format: 'Lakers -140, Celtics +120' or just type the numbers[/dim]")
+    odds_input = Prompt.ask(f"Odds for {home_team} and {away_team}")
+    
+    # Parse odds
+    nums = _ODDS_RE.findall(odds_input)
+    if len(nums) >= 2:
+        home_odds, away_odds = int(nums[0]), int(nums[1])
+    else:
+        console.print("[yellow]Couldn't parse odds. Using defaults (-150, +130)[/yellow]")
+        home_odds = -150
+        away_odds = +130
+    
+    console.print(f"[green]✓ {home_team}: {home_odds:+d}, {away_team}: {away_odds:+d}[/green]\n")
+    
+    # Step 3: Get prediction
+    console.print("[bold cyan]Step 3: What's your prediction?[/bold cyan]")
+    console.print(f"[dim]What % chance does {home_team} have to win? (e.g., '60' for 60%)[/dim]")
+    
+    # FloatPrompt re-asks on non-numeric input; only the range needs checking here
+    while True:
+        home_pct = FloatPrompt.ask(f"Your prediction for {home_team} (%)", default=55.0)
+        if 0 <= home_pct <= 100:
+            break
+        console.print("[yellow]Enter a percentage between 0 and 100[/yellow]")
+    home_prob = home_pct / 100
+    
+    return home_team, away_team, home_odds, away_odds, home_prob
+
+
 def print_header():
     console.print(Panel.fit(
         "[bold cyan]🤖 Sports Edge Analysis AI Assistant[/bold cyan]\n"
@@ -25,125 +363,68 @@ def print_agent_thinking(agent_name: str):
     console.print(f"\n[dim]🤔 {agent_name} is thinking...[/dim]")
 
 def chat_loop():
-    console.print("\n[yellow]Initializing AI agents...[/yellow]")
-    workflow = LLMSportsEdgeFlow()
-    console.print(f"[green]✓ Ready! I have {len(workflow.agents)} specialized agents:[/green]")
-    console.print(f"  • [cyan]OddsAnalyzer[/cyan] - Removes vig from odds")
-    console.print(f"  • [cyan]ForecastEvaluator[/cyan] - Validates predictions")
-    console.print(f"  • [cyan]EdgeCalculator[/cyan] - Finds betting edges")
-    console.print(f"  • [cyan]ReportGenerator[/cyan] - Makes recommendations\n")
-    
-    console.print("[bold]How to use:[/bold]")
-    console.print("  1. Tell me the game (e.g., 'Lakers vs Celtics')")
-    console.print("  2. Give me the odds (e.g., 'Lakers -140, Celtics +120')")
-    console.print("  3. Share your prediction (e.g., 'I think Lakers have 62% chance')")
-    console.print("  4. I'll analyze and recommend!\n")
+    # The agents keep loading in the background; get_workflow() waits only when a game is analyzed
+    console.print("\n[yellow]⏳ Loading my 4 specialized agents in the background:[/yellow]")
+    console.print(_INTRO)
     
     while True:
-        console.print("\n" + "="*70)
-        console.print("[bold magenta]💬 New Analysis[/bold magenta]")
-        console.print("="*70 + "\n")
+        console.print()
+        console.print(_SEP)
+        console.print(_NEW_ANALYSIS)
+        console.print(_SEP)
+        console.print()
         
         # Step 1: Get game info
         console.print("[bold cyan]Step 1: What game do you want to analyze?[/bold cyan]")
+        console.print("[dim]Or enter everything at once: 'Lakers vs Celtics | -140 +120 | 62'[/dim]")
         game_input = Prompt.ask("Enter matchup (e.g., 'Lakers vs Celtics')")
         
         if game_input.lower() in ['quit', 'exit', 'bye']:
             console.print("\n[cyan]👋 Thanks for chatting! Good luck with your bets![/cyan]\n")
             break
         
-        # Parse teams
-        if ' vs ' in game_input.lower():
-            teams = game_input.split(' vs ')
-            home_team = teams[0].strip()
-            away_team = teams[1].strip()
-        elif ' v ' in game_input.lower():
-            teams = game_input.split(' v ')
-            home_team = teams[0].strip()
-            away_team = teams[1].strip()
-        else:
-            console.print("[yellow]I'll assume first team is home. Use 'Team1 vs Team2' format next time.[/yellow]")
-            teams = game_input.split()
-            home_team = teams[0] if len(teams) > 0 else "Home"
-            away_team = teams[1] if len(teams) > 1 else "Away"
-        
-        console.print(f"[green]✓ Got it: {home_team} (home) vs {away_team} (away)[/green]\n")
-        
-        # Step 2: Get odds
-        console.print("[bold cyan]Step 2: What are the current odds?[/bold cyan]")
-        console.print("[dim]Format: 'Lakers -140, Celtics +120' or just type the numbers[/dim]")
-        odds_input = Prompt.ask(f"Odds for {home_team} and {away_team}")
-        
-        # Parse odds
-        try:
-            odds_parts = odds_input.replace(',', ' ').split()
-            home_odds = None
-            away_odds = None
-            
-            for part in odds_parts:
-                if part.lstrip('-+').isdigit():
-                    if home_odds is None:
-                        home_odds = int(part)
-                    else:
-                        away_odds = int(part)
-            
-            if home_odds is None or away_odds is None:
-                raise ValueError("Need two odds")
-                
-        except:
-            console.print("[yellow]Couldn't parse odds. Using defaults (-150, +130)[/yellow]")
-            home_odds = -150
-            away_odds = +130
-        
-        console.print(f"[green]✓ {home_team}: {home_odds:+d}, {away_team}: {away_odds:+d}[/green]\n")
+        if game_input.lower() == 'batch':
+            try:
+                batch_analysis(get_workflow())
+            except RuntimeError as e:
+                console.print(f"[red]❌ Error: {e}[/red]")
+            continue
         
-        # Step 3: Get prediction
-        console.print("[bold cyan]Step 3: What's your prediction?[/bold cyan]")
-        console.print(f"[dim]What % chance does {home_team} have to win? (e.g., '60' for 60%)[/dim]")
-        
-        try:
-            pred_input = Prompt.ask(f"Your prediction for {home_team}")
-            home_prob = float(pred_input.rstrip('%')) / 100
-            
-            if home_prob < 0 or home_prob > 1:
-                raise ValueError()
-                
-        except:
-            console.print("[yellow]Using 55% as default[/yellow]")
-            home_prob = 0.55
-        
-        away_prob = 1.0 - home_prob
-        console.print(f"[green]✓ Your prediction: {home_team} {home_prob:.0%}, {away_team} {away_prob:.0%}[/green]\n")
-        
-        # Prepare data
-        odds_data = {
-            "event_id": f"chat-{home_team}-{away_team}",
-            "sport": "basketball",
-            "league": "NBA",
-            "home_team": home_team,
-            "away_team": away_team,
-            "sportsbook": "User Input",
-            "moneyline": {"home": home_odds, "away": away_odds}
-        }
+        # Quick entry: the whole game on one line skips the guided steps
+        quick = parse_game_line(game_input) if '|' in game_input else None
+        if quick is not None:
+            home_team, away_team, home_odds, away_odds, home_prob = quick
+            console.print(f"[green]✓ {home_team} (home) {home_odds:+d} vs {away_team} (away) {away_odds:+d}[/green]")
+        else:
+            if '|' in game_input:
+                console.print("[yellow]Couldn't read that as 'Team1 vs Team2 | odds1 odds2 | pct', let's go step by step.[/yellow]")
+                game_input = game_input.split('|')[0]
+            home_team, away_team, home_odds, away_odds, home_prob = guided_entry(game_input)
         
-        forecast_data = {
-            "event_id": f"chat-{home_team}-{away_team}",
-            "p_model": {"home": home_prob, "away": away_prob}
-        }
+        # Predictions are analyzed to the whole percent, which is also what the cache keys on
+        home_pct = _whole_pct(home_prob)
+        console.print(f"[green]✓ Your prediction: {home_team} {home_pct}%, {away_team} {100 - home_pct}%[/green]\n")
         
         # Run analysis
         console.print("[bold yellow]🤖 Running AI analysis...[/bold yellow]\n")
         
         try:
-            report = workflow.run(odds_data, forecast_data)
+            workflow = get_workflow()
+            hits_before = _cached_run.cache_info().hits
+            report = _cached_run(workflow, home_odds, away_odds, home_pct, home_team, away_team)
+            cache_hit = _cached_run.cache_info().hits > hits_before
+            if cache_hit:
+                console.print("[dim]⚡ Same game as before - reusing the previous analysis[/dim]")
             
             # Display in chatbot style
-            console.print("\n" + "="*70)
-            console.print("[bold]🎯 AI ANALYSIS RESULTS[/bold]")
-            console.print("="*70 + "\n")
+            console.print()
+            console.print(_SEP)
+            console.print(_RESULTS)
+            console.print(_SEP)
+            console.print()
             
-            # Show each agent's reasoning
-            if 'llm_insights' in report:
+            # Show each agent's reasoning (already streamed unless the analysis was cached)
+            if cache_hit and 'llm_insights' in report:
                 insights = report['llm_insights']
                 
                 console.print("[bold cyan]💭 Agent Reasoning:[/bold cyan]\n")
@@ -195,8 +476,7 @@ def chat_loop():
             
         except Exception as e:
             console.print(f"[red]❌ Error: {e}[/red]")
-            import traceback
-            traceback.print_exc()
+            console.print_exception(show_locals=False)
         
         # Continue?
         console.print()
@@ -206,10 +486,27 @@ def chat_loop():
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Sports Edge Analysis AI Assistant")
+    parser.add_argument(
+        "--file",
+        help="CSV of games to analyze in one batch (home_team, away_team, home_odds, away_odds, home_pct)"
+    )
+    args = parser.parse_args()
+    
+    start_workflow_init()
     print_header()
     
+    if args.file:
+        games = load_games_file(args.file)
+        console.print(f"\n[yellow]Loaded {len(games)} games from {args.file}[/yellow]")
+        try:
+            analyze_games(get_workflow(), games)
+        except RuntimeError as e:
+            console.print(f"[red]❌ Error: {e}[/red]")
+        return
+    
     console.print("\n[bold]Welcome! I'm your AI sports betting analyst.[/bold]")
-    console.print("I use 4 specialized agents to analyze betting opportunities.\n")
+    console.print("I use 4 specialized agents to analyze betting opportunities.\n", markup=False, highlight=False)
     
     console.print("[dim]Type 'quit' or 'exit' anytime to leave.[/dim]\n")
     
@@ -7,15 +7,69 @@ Multi-turn conversation with API/RAG prediction integration
 import sys
 sys.path.insert(0, 'src')
 
+import contextlib
+import re
+import queue
 import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkfont
 import threading
+import time
+import traceback
+from collections import deque
 from datetime import datetime
-from fairllm_agent.agentic_workflow_llm import LLMSportsEdgeFlow
-from fairllm_agent.fivethirtyeight_fetcher import FiveThirtyEightFetcher
+from functools import lru_cache
 
 
 class ConversationalChatGUI:
+    # Input parsing patterns, compiled once
+    _ODDS_RE = re.compile(r'[-+]\d+')
+    _PROB_RE = re.compile(r'(\d+)%?')
+    _SPLIT_RE = re.compile(r'\s+(?:vs?\.?|@|versus)\s+', re.IGNORECASE)
+
+    # Team nicknames accepted when a matchup is typed without a separator
+    _KNOWN_TEAMS = frozenset({
+        # NBA
+        "hawks", "celtics", "nets", "hornets", "bulls", "cavaliers", "cavs", "mavericks", "mavs",
+        "nuggets", "pistons", "warriors", "rockets", "pacers", "clippers", "lakers", "grizzlies",
+        "heat", "bucks", "timberwolves", "wolves", "pelicans", "knicks", "thunder", "magic",
+        "76ers", "sixers", "suns", "blazers", "kings", "spurs", "raptors", "jazz", "wizards",
+        # NFL
+        "cardinals", "falcons", "ravens", "bills", "panthers", "bears", "bengals", "browns",
+        "cowboys", "broncos", "lions", "packers", "texans", "colts", "jaguars", "chiefs",
+        "raiders", "chargers", "rams", "dolphins", "vikings", "patriots", "saints", "giants",
+        "jets", "eagles", "steelers", "49ers", "niners", "seahawks", "buccaneers", "bucs",
+        "titans", "commanders",
+    })
+
+    # Everything the conversation remembers; reset_state keeps the matchup fields
+    _MEMORY_SCHEMA = {
+        "matchup_key": None,     # normalized matchup text the teams were parsed from
+        "home_team": None,
+        "away_team": None,
+        "api_prediction": None,  # None = not looked up yet, {} = no Elo prediction found
+        "home_odds": None,
+        "away_odds": None,
+        "home_prob": None,
+        "away_prob": None,
+    }
+    _MATCHUP_KEYS = ("matchup_key", "home_team", "away_team", "api_prediction")
+
+    # Fields shared by every game analyzed in the chat
+    _ODDS_TEMPLATE = {
+        "sport": "basketball",
+        "league": "NBA",
+        "sportsbook": "User Input"
+    }
+
+    # Shared (workflow, predictor) pairs keyed by config, reused across windows/sessions
+    _pool = {}  # key -> [workflow, predictor, users, released_at (set when users drops to 0)]
+    _pool_lock = threading.Lock()
+    POOL_MAX_IDLE = 600  # seconds a released entry is kept
+    POOL_EVICT_INTERVAL_MS = 60000
+    UI_POLL_MS = 50
+    MAX_MESSAGES = 200  # oldest messages are dropped from the transcript past this
+
     def __init__(self):
         self.window = tk.Tk()
         self.window.title("Sports Edge AI Assistant")
@@ -31,19 +85,40 @@ class ConversationalChatGUI:
         
         # Conversation state
         self.conversation_state = "GREETING"  # GREETING, AWAITING_MATCHUP, AWAITING_ODDS, AWAITING_PREDICTION_CHOICE, AWAITING_MANUAL_PREDICTION, COMPLETE
-        self.current_data = {}
+        self.current_data = dict(self._MEMORY_SCHEMA)
 
         # Placeholder attributes
-        self.canvas = None
-        self.messages_frame = None
+        self.chat = None
+        self._edit_depth = 0  # nesting level of _editable() blocks
+        self._see_pending = False
+        self._message_lines = deque()  # line count of each message in the transcript, oldest first
 
         # Setup UI
         self.setup_ui()
 
+        # Worker threads post UI updates here; the main loop drains them on a timer.
+        # Created before the loader starts, which may post right away
+        self._ui_q = queue.Queue()
+        self.window.after(self.UI_POLL_MS, self._drain_ui_queue)
+
         # Load workflow in background
         threading.Thread(target=self.load_services, daemon=True).start()
 
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.window.after(self.POOL_EVICT_INTERVAL_MS, self._evict_tick)
+
     def setup_ui(self):
+        # Shared Font objects so Tk measures each face once for every widget and tag
+        self._fonts = {
+            "title": tkfont.Font(family="Segoe UI", size=16, weight="bold"),
+            "body": tkfont.Font(family="Segoe UI", size=11),
+            "body_bold": tkfont.Font(family="Segoe UI", size=11, weight="bold"),
+            "result": tkfont.Font(family="Segoe UI", size=10),
+            "small": tkfont.Font(family="Segoe UI", size=9),
+            "small_bold": tkfont.Font(family="Segoe UI", size=9, weight="bold"),
+            "system": tkfont.Font(family="Segoe UI", size=9, slant="italic"),
+        }
+
         # Phone frame
         phone_frame = tk.Frame(self.window, bg="white", bd=0, highlightthickness=0)
         phone_frame.pack(fill="both", expand=True, padx=20, pady=18)
@@ -59,7 +134,7 @@ class ConversationalChatGUI:
         title = tk.Label(
             header_left,
             text="Sports Edge Chat",
-            font=("Segoe UI", 16, "bold"),
+            font=self._fonts["title"],
             bg="#3b46fa",
             fg="white"
         )
@@ -68,7 +143,7 @@ class ConversationalChatGUI:
         subtitle = tk.Label(
             header_left,
             text="Conversational AI analysis",
-            font=("Segoe UI", 9),
+            font=self._fonts["small"],
             bg="#3b46fa",
             fg="#dbe4ff"
         )
@@ -81,7 +156,7 @@ class ConversationalChatGUI:
         tk.Button(
             header_right,
             text="New",
-            font=("Segoe UI", 9, "bold"),
+            font=self._fonts["small_bold"],
             bg="white",
             fg="#3b46fa",
             activebackground="#e5ecff",
@@ -97,7 +172,7 @@ class ConversationalChatGUI:
         menu_line = tk.Label(
             header_right,
             text="―",
-            font=("Segoe UI", 16, "bold"),
+            font=self._fonts["title"],
             bg="#3b46fa",
             fg="white"
         )
@@ -107,19 +182,43 @@ class ConversationalChatGUI:
         chat_container = tk.Frame(phone_frame, bg="white")
         chat_container.pack(fill="both", expand=True, padx=10, pady=(6, 0))
 
-        self.canvas = tk.Canvas(chat_container, bg="white", highlightthickness=0)
-        scrollbar = ttk.Scrollbar(chat_container, orient="vertical", command=self.canvas.yview)
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.chat = tk.Text(
+            chat_container,
+            bg="white",
+            relief=tk.FLAT,
+            highlightthickness=0,
+            wrap="word",
+            padx=8,
+            pady=8,
+            cursor="arrow",
+            state="disabled"
+        )
+        scrollbar = ttk.Scrollbar(chat_container, orient="vertical", command=self.chat.yview)
+        self.chat.configure(yscrollcommand=scrollbar.set)
 
-        self.canvas.pack(side="left", fill="both", expand=True)
+        self.chat.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        self.messages_frame = tk.Frame(self.canvas, bg="white")
-        self.canvas.create_window((0, 0), window=self.messages_frame, anchor="nw")
-
-        self.messages_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        # One tag per sender replaces the per-message bubble widgets
+        self.chat.tag_configure(
+            "user", font=self._fonts["body"], background="#3b46fa", foreground="white",
+            justify="right", lmargin1=200, lmargin2=200, rmargin=8, spacing1=4, spacing3=4
+        )
+        self.chat.tag_configure(
+            "ai", font=self._fonts["body"], background="#f3f4f6", foreground="#111827",
+            lmargin1=8, lmargin2=8, rmargin=200, spacing1=4, spacing3=4
+        )
+        self.chat.tag_configure(
+            "result", font=self._fonts["result"], background="#f3f4f6", foreground="#374151",
+            lmargin1=8, lmargin2=8, rmargin=200, spacing1=4, spacing3=4
+        )
+        self.chat.tag_configure(
+            "recommendation", font=self._fonts["body"], background="#e3f8e8", foreground="#064e3b",
+            lmargin1=8, lmargin2=8, rmargin=200, spacing1=4, spacing3=4
+        )
+        self.chat.tag_configure(
+            "system", font=self._fonts["system"], foreground="#6b7280",
+            justify="center", lmargin1=40, lmargin2=40, rmargin=40, spacing1=4, spacing3=4
         )
 
         # Input area
@@ -132,26 +231,41 @@ class ConversationalChatGUI:
 
         self.input_field = tk.Entry(
             entry_holder,
-            font=("Segoe UI", 11),
+            font=self._fonts["body"],
             bg="#f3f4f6",
             fg="#111827",
             relief=tk.FLAT,
             insertbackground="#111827"
         )
         self.input_field.pack(fill="both", expand=True, padx=10, pady=6)
-        self.input_field.bind("<Return>", lambda e: self.send_message())
+        self.input_field.bind("<Return>", self._on_return)
 
         # Send button
         send_button_holder = tk.Frame(input_bar, bg="white")
         send_button_holder.pack(side="right", padx=(0, 16), pady=10)
 
-        self.send_button = tk.Canvas(
+        # Colors per state live in the style, so enabling/disabling is just a state flip
+        style = ttk.Style(self.window)
+        style.theme_use("clam")
+        style.configure(
+            "Send.TButton",
+            font=self._fonts["body_bold"],
+            background="#3b46fa",
+            foreground="white",
+            borderwidth=0,
+            padding=(14, 4)
+        )
+        style.map(
+            "Send.TButton",
+            background=[("disabled", "#9ca3af"), ("active", "#3b46fa")],
+            foreground=[("disabled", "#e5e7eb")]
+        )
+
+        self.send_button = ttk.Button(
             send_button_holder,
-            width=80,
-            height=32,
-            bg="white",
-            highlightthickness=0,
-            bd=0
+            text="Send",
+            style="Send.TButton",
+            command=self.send_message
         )
         self.send_button.pack()
         self._set_send_button_enabled(False)
@@ -160,7 +274,7 @@ class ConversationalChatGUI:
         self.hint_label = tk.Label(
             phone_frame,
             text='Waiting for AI to load...',
-            font=("Segoe UI", 9),
+            font=self._fonts["small"],
             bg="white",
             fg="#9ca3af"
         )
@@ -170,7 +284,7 @@ class ConversationalChatGUI:
         self.status_label = tk.Label(
             self.window,
             text="Initializing AI agents and prediction API...",
-            font=("Segoe UI", 9),
+            font=self._fonts["small"],
             bg="#000000",
             fg="#e5e7eb",
             anchor="w",
@@ -183,45 +297,104 @@ class ConversationalChatGUI:
 
         self.input_field.focus_set()
 
-    def _on_send_click(self, event):
-        if self.send_enabled:
-            self.send_message()
+    def _on_return(self, event):
+        self.send_message()
 
     def _set_send_button_enabled(self, enabled: bool):
         self.send_enabled = enabled
-        self.send_button.delete("all")
-
-        if enabled:
-            fill = "#3b46fa"
-            text_color = "white"
-            cursor = "hand2"
-        else:
-            fill = "#9ca3af"
-            text_color = "#e5e7eb"
-            cursor = "arrow"
-
-        self.send_button.create_rectangle(0, 0, 80, 32, outline=fill, fill=fill, width=0, tags="btn_bg")
-        self.send_button.create_text(40, 16, text="Send", fill=text_color, font=("Segoe UI", 11, "bold"), tags="btn_label")
-        self.send_button.config(cursor=cursor)
-        self.send_button.bind("<Button-1>", self._on_send_click if enabled else lambda e: None)
+        self.send_button.state(["!disabled"] if enabled else ["disabled"])
+        self.send_button.config(cursor="hand2" if enabled else "arrow")
 
     def load_services(self):
         """Load AI workflow and prediction API in background"""
         try:
-            self.workflow = LLMSportsEdgeFlow()
-            self.predictor = FiveThirtyEightFetcher()
+            self.workflow, self.predictor = self._get_services()
             
             agents_count = len(self.workflow.agents)
             
-            self.window.after(0, lambda: self.status_label.config(
-                text=f"✓ Ready! {agents_count} AI agents + Elo prediction API loaded"
-            ))
-            self.window.after(0, lambda: self._set_send_button_enabled(True))
-            self.window.after(0, self.start_greeting)
+            self._post("status", f"✓ Ready! {agents_count} AI agents + Elo prediction API loaded")
+            self._post("call", self._set_send_button_enabled, True)
+            self._post("call", self.start_greeting)
             
         except Exception as e:
-            self.window.after(0, lambda: self.add_message("system", f"Error loading services: {e}"))
-            self.window.after(0, lambda: self.status_label.config(text="Error - some features unavailable"))
+            self._post("message", "system", f"Error loading services: {e}")
+            self._post("status", "Error - some features unavailable")
+
+    @classmethod
+    def _get_services(cls, sport="NBA", max_concurrent_llm_calls=4):
+        """Return a pooled (workflow, predictor) for this config, building it on first use"""
+        # Imported here so the window paints before the agent modules load
+        from fairllm_agent.agentic_workflow_llm import LLMSportsEdgeFlow
+        from fairllm_agent.fivethirtyeight_fetcher import FiveThirtyEightFetcher
+
+        key = (sport, max_concurrent_llm_calls)
+        with cls._pool_lock:
+            entry = cls._pool.get(key)
+            if entry is None:
+                entry = [LLMSportsEdgeFlow(max_concurrent_llm_calls), FiveThirtyEightFetcher(sport), 0, None]
+                cls._pool[key] = entry
+            entry[2] += 1
+            entry[3] = None
+            return entry[0], entry[1]
+
+    @classmethod
+    def _release_services(cls, workflow):
+        """Drop one user of a pooled workflow; the last one out starts its idle clock"""
+        with cls._pool_lock:
+            for entry in cls._pool.values():
+                if entry[0] is workflow and entry[2] > 0:
+                    entry[2] -= 1
+                    if entry[2] == 0:
+                        entry[3] = time.monotonic()
+
+    @classmethod
+    def _evict_idle(cls, max_idle=None):
+        """Drop pool entries nobody uses that have been idle for longer than max_idle seconds"""
+        max_idle = cls.POOL_MAX_IDLE if max_idle is None else max_idle
+        now = time.monotonic()
+        with cls._pool_lock:
+            for key in [k for k, e in cls._pool.items() if e[2] == 0 and e[3] is not None and now - e[3] > max_idle]:
+                del cls._pool[key]
+
+    def _evict_tick(self):
+        self._evict_idle()
+        self.window.after(self.POOL_EVICT_INTERVAL_MS, self._evict_tick)
+
+    def _post(self, kind, *args):
+        """Queue a UI update from a worker thread (see _drain_ui_queue)"""
+        self._ui_q.put((kind, *args))
+
+    def _drain_ui_queue(self):
+        """Apply all queued UI updates on the main thread, then reschedule"""
+        try:
+            if not self._ui_q.empty():
+                # All messages in this drain share one writable window on the transcript
+                with self._editable():
+                    while True:
+                        try:
+                            kind, *args = self._ui_q.get_nowait()
+                        except queue.Empty:
+                            break
+
+                        # One bad update must not drop the rest of the batch
+                        try:
+                            self._apply_ui_update(kind, args)
+                        except Exception:
+                            traceback.print_exc()
+        finally:
+            self.window.after(self.UI_POLL_MS, self._drain_ui_queue)
+
+    def _apply_ui_update(self, kind, args):
+        if kind == "message":
+            self.add_message(*args)
+        elif kind == "messages":
+            self.add_messages_batch(*args)
+        elif kind == "hint":
+            self.hint_label.config(text=args[0])
+        elif kind == "status":
+            self.status_label.config(text=args[0])
+        elif kind == "call":
+            args[0](*args[1:])
 
     def start_greeting(self):
         """Start the conversation"""
@@ -230,71 +403,46 @@ class ConversationalChatGUI:
         self.hint_label.config(text='Example: "Lakers vs Celtics" or "Chiefs vs Bills"')
         self.conversation_state = "AWAITING_MATCHUP"
 
-    def _scroll_to_bottom(self):
-        self.canvas.update_idletasks()
-        self.canvas.yview_moveto(1.0)
-
     def add_message(self, sender, text):
-        """Add a message bubble to the chat"""
-        row = tk.Frame(self.messages_frame, bg="white")
-        row.pack(fill="x", pady=4)
-
-        wrap_width = 500
-
-        if sender == "user":
-            bubble = tk.Frame(row, bg="#3b46fa")
-            bubble.pack(side="right", padx=(40, 0))
-            label = tk.Label(
-                bubble,
-                text=text,
-                font=("Segoe UI", 11),
-                bg="#3b46fa",
-                fg="white",
-                wraplength=wrap_width,
-                justify="left"
-            )
-            label.pack(padx=12, pady=8)
-
-        elif sender in ("ai", "result", "recommendation"):
-            if sender == "result":
-                bubble_color = "#f3f4f6"
-                text_color = "#374151"
-                font_size = 10
-            elif sender == "recommendation":
-                bubble_color = "#e3f8e8"
-                text_color = "#064e3b"
-                font_size = 11
-            else:  # ai
-                bubble_color = "#f3f4f6"
-                text_color = "#111827"
-                font_size = 11
-
-            bubble = tk.Frame(row, bg=bubble_color)
-            bubble.pack(side="left", padx=(0, 40))
-            label = tk.Label(
-                bubble,
-                text=text,
-                font=("Segoe UI", font_size),
-                bg=bubble_color,
-                fg=text_color,
-                wraplength=wrap_width,
-                justify="left"
-            )
-            label.pack(padx=12, pady=8)
-
-        elif sender == "system":
-            label = tk.Label(
-                row,
-                text=text,
-                font=("Segoe UI", 9, "italic"),
-                bg="white",
-                fg="#6b7280",
-                wraplength=540,
-                justify="center"
-            )
-            label.pack(anchor="center", padx=40)
-
-        self._scroll_to_bottom()
+        """Add a message to the chat"""
+        self.add_messages_batch([(sender, text)])
+
+    @contextlib.contextmanager
+    def _editable(self):
+        """Make the transcript writable for the block; nested blocks toggle state only once"""
+        if self._edit_depth == 0:
+            self.chat.configure(state="normal")
+        self._edit_depth += 1
+        try:
+            yield
+        finally:
+            self._edit_depth -= 1
+            if self._edit_depth == 0:
+                self.chat.configure(state="disabled")
+
+    def add_messages_batch(self, messages):
+        """Add several (sender, text) messages with a single insert pass and scroll"""
+        with self._editable():
+            for sender, text in messages:
+                self.chat.insert("end", text + "\n", sender)
+                self._message_lines.append(text.count("\n") + 1)
+
+            # Keep the transcript bounded: drop the oldest messages in one delete
+            excess = len(self._message_lines) - self.MAX_MESSAGES
+            if excess > 0:
+                lines = sum(self._message_lines.popleft() for _ in range(excess))
+                self.chat.delete("1.0", f"{lines + 1}.0")
+        self._schedule_see_end()
+
+    def _schedule_see_end(self):
+        """Scroll to the end once the current burst of inserts is done"""
+        if not self._see_pending:
+            self._see_pending = True
+            self.window.after_idle(self._do_see_end)
+
+    def _do_see_end(self):
+        self._see_pending = False
+        self.chat.see("end")
 
     def send_message(self):
         """Handle user message"""
@@ -332,77 +480,79 @@ class ConversationalChatGUI:
                 self.handle_manual_prediction(message)
                 
         except Exception as e:
-            self.window.after(0, lambda: self.add_message("ai", f"Sorry, I encountered an error: {str(e)}"))
-            self.window.after(0, lambda: self.add_message("ai", "Let's start over. What game would you like to analyze?"))
-            self.window.after(0, self.reset_state)
+            self._post("messages", [
+                ("ai", f"Sorry, I encountered an error: {str(e)}"),
+                ("ai", "Let's start over. What game would you like to analyze?")
+            ])
+            self._post("call", self.reset_state)
         finally:
-            self.window.after(0, self.reset_input)
+            self._post("call", self.reset_input)
 
     def handle_matchup(self, message):
         """Parse matchup from user input"""
-        teams = self.parse_teams(message)
-        if teams is None:
-            self.window.after(0, lambda: self.add_message(
-                "ai",
-                "I couldn't identify the teams. Please use format like 'Lakers vs Celtics' or 'Chiefs vs Bills'."
-            ))
-            return
+        matchup_key = message.strip().lower()
+        if matchup_key == self.current_data['matchup_key']:
+            # Same game as last time: reuse the parsed teams and Elo lookup
+            teams = [self.current_data['home_team'], self.current_data['away_team']]
+        else:
+            teams = self.parse_teams(message)
+            if teams is None:
+                self._post(
+                    "message", "ai",
+                    "I couldn't identify the teams. Please use format like 'Lakers vs Celtics' or 'Chiefs vs Bills'."
+                )
+                return
 
-        self.current_data['home_team'] = teams[0]
-        self.current_data['away_team'] = teams[1]
+            self._mem_write('matchup_key', matchup_key)
+            self._mem_write('home_team', teams[0])
+            self._mem_write('away_team', teams[1])
+            self._mem_write('api_prediction', None)
         
-        self.window.after(0, lambda: self.add_message(
-            "ai",
-            f"Got it! {teams[0]} vs {teams[1]}. Now, what are the current betting odds?"
-        ))
-        self.window.after(0, lambda: self.hint_label.config(
-            text=f'Example: "{teams[0]} -140, {teams[1]} +120"'
-        ))
-        self.window.after(0, lambda: setattr(self, 'conversation_state', "AWAITING_ODDS"))
+        self._post("message", "ai", f"Got it! {teams[0]} vs {teams[1]}. Now, what are the current betting odds?")
+        self._post("hint", f'Example: "{teams[0]} -140, {teams[1]} +120"')
+        self.conversation_state = "AWAITING_ODDS"
 
     def handle_odds(self, message):
         """Parse odds from user input"""
         odds = self.parse_odds(message)
         if odds is None:
-            self.window.after(0, lambda: self.add_message(
-                "ai",
+            self._post(
+                "message", "ai",
                 "I couldn't parse those odds. Please use format like '-140, +120' or 'home -140 away +120'."
-            ))
+            )
             return
 
-        self.current_data['home_odds'] = odds[0]
-        self.current_data['away_odds'] = odds[1]
+        self._mem_write('home_odds', odds[0])
+        self._mem_write('away_odds', odds[1])
         
         # Check if we have API predictions available
         home = self.current_data['home_team']
         away = self.current_data['away_team']
         
-        prediction = None
-        if self.predictor:
-            prediction = self.predictor.get_game_prediction(home, away)
+        prediction = self.current_data['api_prediction']
+        if prediction is None and self.predictor:
+            prediction = self._cached_prediction(self.predictor, home.strip().lower(), away.strip().lower()) or {}
+            self._mem_write('api_prediction', prediction)
         
         if prediction:
-            self.window.after(0, lambda: self.add_message(
-                "ai",
-                f"Perfect! I found an Elo prediction for this game: {home} has a {prediction['home_prob']:.0%} chance to win."
-            ))
-            self.window.after(0, lambda: self.add_message(
-                "ai",
-                "Would you like to use this prediction, or do you have your own? (Type 'use elo' or enter your own like '62%')"
-            ))
-            self.window.after(0, lambda: self.hint_label.config(
-                text='Type "use elo" or enter your prediction like "62%"'
-            ))
-            self.current_data['api_prediction'] = prediction
+            msgs = [
+                ("ai", f"Perfect! I found an Elo prediction for this game: {home} has a {prediction['home_prob']:.0%} chance to win."),
+                ("ai", "Would you like to use this prediction, or do you have your own? (Type 'use elo' or enter your own like '62%')")
+            ]
+            self._post("messages", msgs)
+            self._post("hint", 'Type "use elo" or enter your prediction like "62%"')
             self.conversation_state = "AWAITING_PREDICTION_CHOICE"
         else:
-            self.window.after(0, lambda: self.add_message(
-                "ai",
-                f"Great! Now, what's your prediction? What % chance does {home} have to win?"
-            ))
-            self.window.after(0, lambda: self.hint_label.config(text='Example: "62%" or "58"'))
+            self._post("message", "ai", f"Great! Now, what's your prediction? What % chance does {home} have to win?")
+            self._post("hint", 'Example: "62%" or "58"')
             self.conversation_state = "AWAITING_MANUAL_PREDICTION"
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _cached_prediction(predictor, home_key, away_key):
+        """Elo prediction lookup, memoized on the normalized matchup"""
+        return predictor.get_game_prediction(home_key, away_key)
+
     def handle_prediction_choice(self, message):
         """Handle user choice between API prediction or manual"""
         message_lower = message.lower()
@@ -410,70 +560,64 @@ class ConversationalChatGUI:
         if 'elo' in message_lower or 'api' in message_lower or 'use' in message_lower:
             # Use API prediction
             prediction = self.current_data['api_prediction']
-            self.current_data['home_prob'] = prediction['home_prob']
-            self.current_data['away_prob'] = prediction['away_prob']
+            self._mem_write('home_prob', prediction['home_prob'])
+            self._mem_write('away_prob', prediction['away_prob'])
             
-            self.window.after(0, lambda: self.add_message(
-                "ai",
-                f"Using Elo prediction: {self.current_data['home_team']} {prediction['home_prob']:.0%}, {self.current_data['away_team']} {prediction['away_prob']:.0%}"
-            ))
-            self.window.after(0, lambda: self.add_message("ai", "Analyzing now..."))
-            self.window.after(0, self.run_analysis)
+            msgs = [
+                ("ai", f"Using Elo prediction: {self.current_data['home_team']} {prediction['home_prob']:.0%}, {self.current_data['away_team']} {prediction['away_prob']:.0%}"),
+                ("ai", "Analyzing now...")
+            ]
+            self._post("messages", msgs)
+            self._run_analysis_worker()
         else:
             # Try to parse as manual prediction
             prob = self.parse_probability(message)
             if prob is None:
-                self.window.after(0, lambda: self.add_message(
-                    "ai",
+                self._post(
+                    "message", "ai",
                     "I couldn't parse that. Type 'use elo' for the API prediction, or enter a percentage like '62%'."
-                ))
+                )
                 return
             
-            self.current_data['home_prob'] = prob
-            self.current_data['away_prob'] = 1.0 - prob
+            self._mem_write('home_prob', prob)
+            self._mem_write('away_prob', 1.0 - prob)
             
-            self.window.after(0, lambda: self.add_message(
-                "ai",
-                f"Got your prediction: {self.current_data['home_team']} {prob:.0%}. Running analysis..."
-            ))
-            self.window.after(0, self.run_analysis)
+            self._post("message", "ai", f"Got your prediction: {self.current_data['home_team']} {prob:.0%}. Running analysis...")
+            self._run_analysis_worker()
 
     def handle_manual_prediction(self, message):
         """Parse manual prediction"""
         prob = self.parse_probability(message)
         if prob is None:
-            self.window.after(0, lambda: self.add_message(
-                "ai",
-                "Please enter a valid probability like '62%' or '58'."
-            ))
+            self._post("message", "ai", "Please enter a valid probability like '62%' or '58'.")
             return
 
-        self.current_data['home_prob'] = prob
-        self.current_data['away_prob'] = 1.0 - prob
+        self._mem_write('home_prob', prob)
+        self._mem_write('away_prob', 1.0 - prob)
         
-        self.window.after(0, lambda: self.add_message("ai", "Perfect! Analyzing now..."))
-        self.window.after(0, self.run_analysis)
+        self._post("message", "ai", "Perfect! Analyzing now...")
+        self._run_analysis_worker()
 
-    def run_analysis(self):
-        """Run the full analysis"""
+    def _run_analysis_worker(self):
+        """Run the full analysis; called on the conversation worker thread"""
         try:
-            self.status_label.config(text="Running AI analysis...")
+            self._post("status", "Running AI analysis...")
             
-            odds_data = {
-                "event_id": f"chat-{self.current_data['home_team']}-{self.current_data['away_team']}",
-                "sport": "basketball",
-                "league": "NBA",
+            event_id = f"chat-{self.current_data['home_team']}-{self.current_data['away_team']}"
+            
+            odds_data = self._ODDS_TEMPLATE.copy()
+            odds_data.update({
+                "event_id": event_id,
                 "home_team": self.current_data['home_team'],
                 "away_team": self.current_data['away_team'],
-                "sportsbook": "User Input",
                 "moneyline": {
                     "home": self.current_data['home_odds'],
                     "away": self.current_data['away_odds']
                 }
-            }
+            })
             
             forecast_data = {
-                "event_id": f"chat-{self.current_data['home_team']}-{self.current_data['away_team']}",
+                "event_id": event_id,
                 "p_model": {
                     "home": self.current_data['home_prob'],
                     "away": self.current_data['away_prob']
@@ -482,25 +626,25 @@ class ConversationalChatGUI:
             
             report = self.workflow.run(odds_data, forecast_data)
             
-            self.window.after(0, lambda: self.display_results(report))
+            self._post("call", self.display_results, report)
             self.conversation_state = "COMPLETE"
             
         except Exception as e:
-            self.window.after(0, lambda: self.add_message("ai", f"Analysis error: {str(e)}"))
+            self._post("message", "ai", f"Analysis error: {str(e)}")
 
     def display_results(self, report):
         """Display the analysis results"""
-        self.add_message("ai", "Analysis complete! Here's what I found:")
+        msgs = [("ai", "Analysis complete! Here's what I found:")]
         
         # Show LLM insights if available
         if 'llm_insights' in report:
             insights = report['llm_insights']
             
             if insights.get('odds_analysis') and insights['odds_analysis'] != "Analyzed odds and removed vig using standard mathematical formulas.":
-                self.add_message("result", f"📊 {insights['odds_analysis']}")
+                msgs.append(("result", f"📊 {insights['odds_analysis']}"))
             
             if insights.get('edge_insight') and insights['edge_insight'] != "Edge calculated. Positive edges indicate potential betting value.":
-                self.add_message("result", f"💎 {insights['edge_insight']}")
+                msgs.append(("result", f"💎 {insights['edge_insight']}"))
 
         # Key metrics
         home = self.current_data['home_team']
@@ -512,39 +656,37 @@ class ConversationalChatGUI:
         home_edge = report["edge_analysis"]["edge_pct"]["home"]
         away_edge = report["edge_analysis"]["edge_pct"]["away"]
         
-        self.add_message(
+        msgs.append((
             "result",
             f"Fair odds: {home} {fair_home:.1%}, {away} {fair_away:.1%}\n"
             f"Edge: {home} {home_edge:+.2f}%, {away} {away_edge:+.2f}%"
-        )
+        ))
         
         # Recommendation
         rec = report.get('llm_recommendation', report['recommendation'])
-        self.add_message("recommendation", f"💰 {rec}")
+        msgs.append(("recommendation", f"💰 {rec}"))
         
         # Offer new analysis
-        self.add_message("ai", "Want to analyze another game? Type 'yes' or tell me the matchup!")
+        msgs.append(("ai", "Want to analyze another game? Type 'yes' or tell me the matchup!"))
+        self.add_messages_batch(msgs)
         self.hint_label.config(text='Type "yes" to start fresh, or name a new matchup')
         self.status_label.config(text="Analysis complete")
 
     # Parsing helpers
     def parse_teams(self, text):
         """Extract team names"""
-        text = text.lower()
-        if ' vs ' in text or ' v ' in text:
-            parts = text.replace(' v ', ' vs ').split(' vs ')
+        parts = self._SPLIT_RE.split(text.strip(), maxsplit=1)
+        if len(parts) == 2:
             return [parts[0].strip().title(), parts[1].strip().title()]
         
         words = text.split()
-        if len(words) >= 2:
+        if len(words) == 2 and words[0].lower() in self._KNOWN_TEAMS and words[1].lower() in self._KNOWN_TEAMS:
             return [words[0].title(), words[1].title()]
         return None
 
     def parse_odds(self, text):
         """Extract odds"""
-        import re
-        odds_pattern = r'[-+]\d+'
-        odds = re.findall(odds_pattern, text)
+        odds = self._ODDS_RE.findall(text)
         
         if len(odds) >= 2:
             return [int(odds[0]), int(odds[1])]
@@ -552,18 +694,22 @@ class ConversationalChatGUI:
 
     def parse_probability(self, text):
         """Extract probability percentage"""
-        import re
-        prob_pattern = r'(\d+)%?'
-        probs = re.findall(prob_pattern, text)
+        probs = self._PROB_RE.findall(text)
         
         if probs:
             prob = float(probs[0]) / 100 if int(probs[0]) > 1 else float(probs[0])
             return max(0.01, min(0.99, prob))
         return None
 
+    def _mem_write(self, key, value):
+        """Single write path into the conversation memory"""
+        if key not in self._MEMORY_SCHEMA:
+            raise KeyError(f"Unknown memory field: {key}")
+        self.current_data[key] = value
+
     def reset_state(self):
-        """Reset conversation state"""
-        self.current_data = {}
+        """Reset conversation state, remembering only the last matchup"""
+        self.current_data = dict(self._MEMORY_SCHEMA) | {k: self.current_data[k] for k in self._MATCHUP_KEYS}
         self.conversation_state = "AWAITING_MATCHUP"
         self.hint_label.config(text='Example: "Lakers vs Celtics"')
 
@@ -576,10 +722,22 @@ class ConversationalChatGUI:
 
     def reset_conversation(self):
         """Start new conversation"""
-        for child in self.messages_frame.winfo_children():
-            child.destroy()
+        self._cached_prediction.cache_clear()
+        self.current_data = dict(self._MEMORY_SCHEMA)
         self.reset_state()
-        self.add_message("ai", "New conversation! What matchup would you like to analyze?")
+
+        # Clear and greet inside one writable block; nothing to delete if already empty
+        with self._editable():
+            if self.chat.index("end-1c") != "1.0":
+                self.chat.delete("1.0", "end")
+                self._message_lines.clear()
+            self.add_message("ai", "New conversation! What matchup would you like to analyze?")
+
+    def close(self):
+        """Return the services to the pool and close the window"""
+        if self.workflow is not None:
+            self._release_services(self.workflow)
+        self.window.destroy()
 
     def run(self):
         """Start the GUI"""
@@ -7,14 +7,29 @@ Proper message ordering and scroll behavior
 import sys
 sys.path.insert(0, 'src')
 
+import asyncio
+import queue
+import re
 import tkinter as tk
 from tkinter import ttk
 import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from fairllm_agent.agentic_workflow_llm import LLMSportsEdgeFlow
+from functools import lru_cache
+
+# Numbers in a chat message, scanned in one pass: signed ones are odds, unsigned ones percentages
+_NUMBER_RE = re.compile(r"(?P<odds>[-+]\d+)|(?P<pct>\d+)%?")
+_VS_RE = re.compile(r"\s+vs?\s+", re.IGNORECASE)
+_NAME_RE = re.compile(r"[A-Za-z][\w.'-]*")
 
 
 class ChatbotFixed:
+    MAX_MESSAGES = 200  # oldest messages are deleted past this
+    PAGE_SIZE = 100  # older messages brought back per scroll to the top
+    MAX_CACHED_RESULTS = 128
+    UI_POLL_MS = 30  # how often the main thread applies queued UI updates
+
     def __init__(self):
         self.window = tk.Tk()
         self.window.title("Sports Edge AI Assistant")
@@ -28,14 +43,51 @@ class ChatbotFixed:
         self.send_enabled = False
 
         # Placeholder attributes
-        self.canvas = None
-        self.messages_frame = None
+        self.chat = None
+        self._message_lines = deque()  # line count of each message in the transcript, oldest first
+        self._history = []  # every (sender, text) of the session; the transcript shows a window of it
+        self._visible_start = 0  # index in _history of the oldest message in the transcript
+        self._paging = False
+        self._scroll_pending = False
+
+        # Reports for games already analyzed, keyed by matchup/odds/prediction (event loop only)
+        self._result_cache = OrderedDict()
+
+        # Fields shared by every game analyzed in the chat
+        self._odds_template = {
+            "sport": "basketball",
+            "league": "NBA",
+            "sportsbook": "User Input"
+        }
+
+        # UI updates posted by worker threads, applied on the main thread by _drain_ui
+        self._ui_queue = queue.SimpleQueue()
+        self._ui_handlers = {
+            "message": self.add_message,
+            "status": lambda text: self.status_label.config(text=text),
+            "hint": lambda text: self.hint_label.config(text=text),
+            "examples": self.show_examples,
+            "results": self.display_results,
+            "reset_input": self.reset_input,
+        }
+
+        # One background event loop runs every analysis; blocking calls go to its thread pool
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sportsedge")
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(self._executor)  # used by asyncio.to_thread
+        self._in_flight = 0
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
+        # Start loading the workflow before building the widgets so the two overlap.
+        # It only queues UI updates; the main-thread _drain_ui poll (armed after
+        # setup_ui) applies them once the main loop runs.
+        self._submit(self.load_workflow())
 
         # Setup UI
         self.setup_ui()
+        self.window.after(self.UI_POLL_MS, self._drain_ui)
 
-        # Load workflow in background
-        threading.Thread(target=self.load_workflow, daemon=True).start()
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def setup_ui(self):
         # Phone frame
@@ -102,29 +154,89 @@ class ChatbotFixed:
         chat_container = tk.Frame(phone_frame, bg="white")
         chat_container.pack(fill="both", expand=True, padx=10, pady=(6, 0))
 
-        self.canvas = tk.Canvas(chat_container, bg="white", highlightthickness=0)
-        scrollbar = ttk.Scrollbar(chat_container, orient="vertical", command=self.canvas.yview)
-        self.canvas.configure(yscrollcommand=scrollbar.set)
-
-        self.canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        self.chat = tk.Text(
+            chat_container,
+            bg="white",
+            relief=tk.FLAT,
+            highlightthickness=0,
+            wrap="word",
+            padx=8,
+            pady=8,
+            cursor="arrow",
+            state="disabled"
+        )
+        self.chat_scrollbar = ttk.Scrollbar(chat_container, orient="vertical", command=self.chat.yview)
+        self.chat.configure(yscrollcommand=self._on_chat_scroll)
 
-        self.messages_frame = tk.Frame(self.canvas, bg="white")
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.messages_frame, anchor="nw")
+        self.chat.pack(side="left", fill="both", expand=True)
+        self.chat_scrollbar.pack(side="right", fill="y")
 
-        # Bind to update scroll region
-        self.messages_frame.bind("<Configure>", self._on_frame_configure)
-        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        # One tag per sender styles the messages; no widget per bubble
+        self.chat.tag_configure(
+            "user", font=("Segoe UI", 11), background="#3b46fa", foreground="white",
+            justify="right", lmargin1=200, lmargin2=200, rmargin=8, spacing1=4, spacing3=4
+        )
+        self.chat.tag_configure(
+            "ai", font=("Segoe UI", 11), background="#f3f4f6", foreground="#111827",
+            lmargin1=8, lmargin2=8, rmargin=200, spacing1=4, spacing3=4
+        )
+        self.chat.tag_configure(
+            "result", font=("Segoe UI", 10), background="#f3f4f6", foreground="#374151",
+            lmargin1=8, lmargin2=8, rmargin=200, spacing1=4, spacing3=4
+        )
+        self.chat.tag_configure(
+            "recommendation", font=("Segoe UI", 11), background="#e3f8e8", foreground="#064e3b",
+            lmargin1=8, lmargin2=8, rmargin=200, spacing1=4, spacing3=4
+        )
+        self.chat.tag_configure(
+            "system", font=("Segoe UI", 9, "italic"), foreground="#6b7280",
+            justify="center", lmargin1=40, lmargin2=40, rmargin=40, spacing1=4, spacing3=4
+        )
 
         # Bottom input area with examples
         input_section = tk.Frame(phone_frame, bg="white")
         input_section.pack(fill="x", side="bottom", pady=(0, 5))
 
+        # Last-analysis panel: fixed labels updated in place by display_results
+        self.summary_panel = tk.Frame(phone_frame, bg="#f3f4f6")
+        self._summary_labels = {}
+        for row, (key, title) in enumerate((("fair", "Fair odds"), ("model", "Your prediction"), ("edge", "Betting edge"))):
+            tk.Label(
+                self.summary_panel,
+                text=title,
+                font=("Segoe UI", 9, "bold"),
+                bg="#f3f4f6",
+                fg="#374151",
+                anchor="w"
+            ).grid(row=row, column=0, sticky="w", padx=(12, 16), pady=1)
+            for col, side in enumerate(("home", "away"), start=1):
+                label = tk.Label(self.summary_panel, font=("Segoe UI", 10), bg="#f3f4f6", fg="#374151", anchor="w")
+                label.grid(row=row, column=col, sticky="w", padx=(0, 16), pady=1)
+                self._summary_labels[key, side] = label
+
         # Example suggestions (clickable chips)
         self.examples_frame = tk.Frame(input_section, bg="white", height=35)
         self.examples_frame.pack(fill="x", padx=16, pady=(0, 5))
         self.examples_frame.pack_propagate(False)
 
+        # Example chips are built once; show_examples only swaps their text
+        self._example_buttons = [
+            tk.Button(
+                self.examples_frame,
+                font=("Segoe UI", 9),
+                bg="#f3f4f6",
+                fg="#374151",
+                activebackground="#e5e7eb",
+                activeforeground="#111827",
+                relief=tk.FLAT,
+                bd=0,
+                padx=12,
+                pady=4,
+                cursor="hand2"
+            )
+            for _ in range(3)
+        ]
+
         # Input bar
         input_bar = tk.Frame(input_section, bg="white", height=70)
         input_bar.pack(fill="x")
@@ -133,8 +245,10 @@ class ChatbotFixed:
         entry_holder = tk.Frame(input_bar, bg="#f3f4f6")
         entry_holder.pack(side="left", fill="x", expand=True, padx=(16, 8), pady=10)
 
+        self._input_var = tk.StringVar(self.window)
         self.input_field = tk.Entry(
             entry_holder,
+            textvariable=self._input_var,
             font=("Segoe UI", 11),
             bg="#f3f4f6",
             fg="#111827",
@@ -148,13 +262,28 @@ class ChatbotFixed:
         send_button_holder = tk.Frame(input_bar, bg="white")
         send_button_holder.pack(side="right", padx=(0, 16), pady=10)
 
-        self.send_button = tk.Canvas(
+        # The style maps the disabled colors, so toggling is just a state change
+        style = ttk.Style(self.window)
+        style.theme_use("clam")
+        style.configure(
+            "Send.TButton",
+            font=("Segoe UI", 11, "bold"),
+            background="#3b46fa",
+            foreground="white",
+            borderwidth=0,
+            padding=(14, 4)
+        )
+        style.map(
+            "Send.TButton",
+            background=[("disabled", "#9ca3af"), ("active", "#3b46fa")],
+            foreground=[("disabled", "#e5e7eb")]
+        )
+
+        self.send_button = ttk.Button(
             send_button_holder,
-            width=80,
-            height=32,
-            bg="white",
-            highlightthickness=0,
-            bd=0
+            text="Send",
+            style="Send.TButton",
+            command=self.send_message
         )
         self.send_button.pack()
         self._set_send_button_enabled(False)
@@ -182,51 +311,23 @@ class ChatbotFixed:
         self.status_label.pack(fill="x", side="bottom", pady=(0, 6))
 
         # Initial messages
-        self.add_message("system", "Welcome to Sports Edge Chat.")
-        self.add_message("system", "Once the AI loads, describe a matchup with odds and your prediction.")
+        self.add_messages_batch([
+            ("system", "Welcome to Sports Edge Chat."),
+            ("system", "Once the AI loads, describe a matchup with odds and your prediction."),
+        ])
         
         # Set initial examples
         self.show_examples([])
 
         self.input_field.focus_set()
 
-    def _on_frame_configure(self, event):
-        """Update scroll region when frame size changes"""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        
-    def _on_canvas_configure(self, event):
-        """Update frame width when canvas resizes"""
-        canvas_width = event.width
-        self.canvas.itemconfig(self.canvas_window, width=canvas_width)
-
-    def _on_send_click(self, event):
-        if self.send_enabled:
-            self.send_message()
-
     def _set_send_button_enabled(self, enabled: bool):
         self.send_enabled = enabled
-        self.send_button.delete("all")
-
-        if enabled:
-            fill = "#3b46fa"
-            text_color = "white"
-            cursor = "hand2"
-        else:
-            fill = "#9ca3af"
-            text_color = "#e5e7eb"
-            cursor = "arrow"
-
-        self.send_button.create_rectangle(0, 0, 80, 32, outline=fill, fill=fill, width=0, tags="btn_bg")
-        self.send_button.create_text(40, 16, text="Send", fill=text_color, font=("Segoe UI", 11, "bold"), tags="btn_label")
-        self.send_button.config(cursor=cursor)
-        self.send_button.bind("<Button-1>", self._on_send_click if enabled else lambda e: None)
+        self.send_button.state(["!disabled"] if enabled else ["disabled"])
+        self.send_button.config(cursor="hand2" if enabled else "arrow")
 
     def show_examples(self, examples):
         """Display clickable example suggestions"""
-        # Clear existing examples
-        for widget in self.examples_frame.winfo_children():
-            widget.destroy()
-
         if not examples:
             examples = [
                 "Lakers vs Celtics, Lakers -140, Celtics +120, Lakers 62%",
@@ -234,144 +335,146 @@ class ChatbotFixed:
                 "Chiefs vs Bills, Chiefs -200, Bills +170, Chiefs 58%"
             ]
 
-        # Create scrollable container
-        canvas = tk.Canvas(self.examples_frame, bg="white", highlightthickness=0, height=30)
-        canvas.pack(side="left", fill="both", expand=True)
-
-        scrollbar = tk.Scrollbar(self.examples_frame, orient="horizontal", command=canvas.xview)
-        scrollbar.pack(side="bottom", fill="x")
-        canvas.configure(xscrollcommand=scrollbar.set)
-
-        container = tk.Frame(canvas, bg="white")
-        canvas.create_window((0, 0), window=container, anchor="nw")
-
-        for example in examples:
-            btn = tk.Button(
-                container,
-                text=example if len(example) < 50 else example[:47] + "...",
-                font=("Segoe UI", 9),
-                bg="#f3f4f6",
-                fg="#374151",
-                activebackground="#e5e7eb",
-                activeforeground="#111827",
-                relief=tk.FLAT,
-                bd=0,
-                padx=12,
-                pady=4,
-                command=lambda ex=example: self.use_example(ex),
-                cursor="hand2"
-            )
-            btn.pack(side="left", padx=4)
-
-        container.update_idletasks()
-        canvas.configure(scrollregion=canvas.bbox("all"))
+        for i, btn in enumerate(self._example_buttons):
+            if i < len(examples):
+                example = examples[i]
+                btn.config(
+                    text=example if len(example) < 50 else example[:47] + "...",
+                    command=lambda ex=example: self.use_example(ex)
+                )
+                btn.pack(side="left", padx=4)
+            else:
+                btn.pack_forget()
 
     def use_example(self, example):
         """Fill input with example text"""
-        self.input_field.delete(0, tk.END)
-        self.input_field.insert(0, example)
+        self._input_var.set(example)
         self.input_field.focus()
 
-    def load_workflow(self):
+    def _on_close(self):
+        """Drop pending work, stop the event loop and close the window"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self.window.destroy()
+
+    def _submit(self, coro):
+        """Schedule a coroutine on the background event loop"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    async def load_workflow(self):
         """Load AI workflow in background"""
         try:
-            self.workflow = LLMSportsEdgeFlow()
+            # Imported here so the window paints before the agent modules load
+            from fairllm_agent.agentic_workflow_llm import LLMSportsEdgeFlow
+
+            self.workflow = await asyncio.to_thread(LLMSportsEdgeFlow)
             agents_count = len(self.workflow.agents)
 
-            self.window.after(0, lambda: self.status_label.config(
-                text=f"✓ Ready! {agents_count} AI agents loaded"
-            ))
-            self.window.after(0, lambda: self._set_send_button_enabled(True))
-            self.window.after(0, lambda: self.add_message(
-                "system",
+            self._post("status", f"✓ Ready! {agents_count} AI agents loaded")
+            self._post("reset_input")
+            self._post(
+                "message", "system",
                 "AI loaded! Enter a matchup with odds and your prediction, or click an example below."
-            ))
-            self.window.after(0, lambda: self.hint_label.config(
-                text='Click an example or type your own'
-            ))
-            self.window.after(0, lambda: self.show_examples([
+            )
+            self._post("hint", 'Click an example or type your own')
+            self._post("examples", [
                 "Lakers vs Celtics, Lakers -140, Celtics +120, Lakers 62%",
                 "Warriors vs Suns, -150, +130, Warriors 55%",
                 "Chiefs vs Bills, -200, +170, 58%"
-            ]))
+            ])
+            self._loop.create_task(self._warmup())
 
         except Exception as e:
-            self.window.after(0, lambda: self.add_message("system", f"Error loading: {e}"))
+            self._post("message", "system", f"Error loading: {e}")
+            self._post("status", "Failed to load AI agents")
 
-    def _scroll_to_bottom(self):
-        """Scroll to bottom of chat"""
-        self.canvas.update_idletasks()
-        self.canvas.yview_moveto(1.0)
-
-    def add_message(self, sender, text):
-        """Add a message bubble - MESSAGES APPEND TO BOTTOM"""
-        row = tk.Frame(self.messages_frame, bg="white")
-        row.pack(fill="x", pady=4, anchor="n")  # anchor="n" keeps them at top of frame
-
-        wrap_width = 500
-
-        if sender == "user":
-            bubble = tk.Frame(row, bg="#3b46fa")
-            bubble.pack(side="right", padx=(40, 0))
-            label = tk.Label(
-                bubble,
-                text=text,
-                font=("Segoe UI", 11),
-                bg="#3b46fa",
-                fg="white",
-                wraplength=wrap_width,
-                justify="left"
-            )
-            label.pack(padx=12, pady=8)
-
-        elif sender in ("ai", "result", "recommendation"):
-            if sender == "result":
-                bubble_color = "#f3f4f6"
-                text_color = "#374151"
-                font_size = 10
-            elif sender == "recommendation":
-                bubble_color = "#e3f8e8"
-                text_color = "#064e3b"
-                font_size = 11
-            else:
-                bubble_color = "#f3f4f6"
-                text_color = "#111827"
-                font_size = 11
-
-            bubble = tk.Frame(row, bg=bubble_color)
-            bubble.pack(side="left", padx=(0, 40))
-            label = tk.Label(
-                bubble,
-                text=text,
-                font=("Segoe UI", font_size),
-                bg=bubble_color,
-                fg=text_color,
-                wraplength=wrap_width,
-                justify="left"
-            )
-            label.pack(padx=12, pady=8)
-
-        elif sender == "system":
-            label = tk.Label(
-                row,
-                text=text,
-                font=("Segoe UI", 9, "italic"),
-                bg="white",
-                fg="#6b7280",
-                wraplength=540,
-                justify="center"
-            )
-            label.pack(anchor="center", padx=40)
+    def _post(self, op, *args):
+        """Queue a UI update from any thread; only the main thread touches Tk"""
+        self._ui_queue.put((op, args))
+
+    def _drain_ui(self):
+        """Apply all queued UI updates on the main thread, then poll again"""
+        try:
+            while True:
+                try:
+                    op, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._ui_handlers[op](*args)
+        finally:
+            self.window.after(self.UI_POLL_MS, self._drain_ui)
 
-        # Scroll to bottom after adding message
-        self.window.after(10, self._scroll_to_bottom)
+    def _scroll_to_bottom(self):
+        """Scroll to bottom of chat once Tk is idle; repeated calls coalesce"""
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        self.window.after_idle(self._do_scroll_to_bottom)
+
+    def _do_scroll_to_bottom(self):
+        self._scroll_pending = False
+        self.chat.see("end")
+
+    def add_message(self, sender, text, defer_scroll=False):
+        """Add a message - MESSAGES APPEND TO BOTTOM
+
+        Pass defer_scroll=True when more messages follow; the last one scrolls.
+        """
+        self._insert_messages([(sender, text)])
+        if not defer_scroll:
+            self._scroll_to_bottom()
+
+    def add_messages_batch(self, messages):
+        """Add several (sender, text) messages, scrolling once at the end"""
+        self._insert_messages(messages)
+        self._scroll_to_bottom()
+
+    def _insert_messages(self, messages):
+        """Append tagged messages, then drop the oldest past MAX_MESSAGES in one delete"""
+        self.chat.configure(state="normal")
+        for sender, text in messages:
+            self.chat.insert("end", text + "\n", sender)
+            self._message_lines.append(text.count("\n") + 1)
+            self._history.append((sender, text))
+
+        excess = len(self._message_lines) - self.MAX_MESSAGES
+        if excess > 0:
+            lines = sum(self._message_lines.popleft() for _ in range(excess))
+            self.chat.delete("1.0", f"{lines + 1}.0")
+            self._visible_start += excess
+        self.chat.configure(state="disabled")
+
+    def _on_chat_scroll(self, first, last):
+        """Update the scrollbar; reaching the top brings back older messages"""
+        self.chat_scrollbar.set(first, last)
+        if float(first) <= 0.0 and self._visible_start and not self._paging:
+            self._paging = True
+            self.window.after_idle(self._page_in_older)
+
+    def _page_in_older(self):
+        """Insert the previous PAGE_SIZE messages above the transcript, keeping the view in place"""
+        self._paging = False
+        start = max(0, self._visible_start - self.PAGE_SIZE)
+        older = self._history[start:self._visible_start]
+
+        self.chat.configure(state="normal")
+        inserted = 0
+        for sender, text in reversed(older):
+            self.chat.insert("1.0", text + "\n", sender)
+            lines = text.count("\n") + 1
+            self._message_lines.appendleft(lines)
+            inserted += lines
+        self.chat.configure(state="disabled")
+
+        self._visible_start = start
+        self.chat.yview(f"{inserted + 1}.0")
 
     def send_message(self):
         """Handle user message"""
         if self.loading:
             return
 
-        message = self.input_field.get().strip()
+        message = self._input_var.get().strip()
         if not message:
             return
 
@@ -379,7 +482,7 @@ class ChatbotFixed:
             self.add_message("system", "AI agents are still loading. Please wait.")
             return
 
-        self.input_field.delete(0, tk.END)
+        self._input_var.set("")
         self.add_message("user", message)
 
         # Update examples
@@ -393,148 +496,168 @@ class ChatbotFixed:
         self.loading = True
         self._set_send_button_enabled(False)
         self.status_label.config(text="Analyzing matchup...")
-        threading.Thread(target=self.process_message, args=(message,), daemon=True).start()
+        self._submit(self.process_message(message))
+
+    async def _warmup(self):
+        """Warm the models once after loading; skipped if a real request is already running"""
+        if self.workflow is not None and not self._in_flight:
+            await asyncio.to_thread(self.workflow.warmup)
 
-    def process_message(self, message):
+    async def process_message(self, message):
         """Process the message and run analysis"""
+        self._in_flight += 1
         try:
             parsed = self.parse_message(message)
 
             if parsed is None:
-                self.window.after(0, lambda: self.add_message(
-                    "ai",
+                self._post(
+                    "message", "ai",
                     "I could not understand that input. Try: 'Lakers vs Celtics, Lakers -140, Celtics +120, Lakers 62%'"
-                ))
-                self.window.after(0, self.reset_input)
+                )
                 return
 
-            self.window.after(0, lambda: self.add_message("system", "Running AI analysis..."))
+            # Team names are case-folded so "lakers" and "Lakers" share an entry
+            key = (
+                parsed['home'].casefold(), parsed['away'].casefold(),
+                parsed['home_odds'], parsed['away_odds'], round(parsed['home_prob'], 4)
+            )
+            report = self._result_cache.get(key)
+            if report is not None:
+                self._result_cache.move_to_end(key)
+                self._post("message", "system", "Same game as before - showing the previous analysis.")
+                self._post("results", report, parsed)
+                return
+
+            self._post("message", "system", "Running AI analysis...")
 
             # Build data
-            odds_data = {
-                "event_id": f"chat-{parsed['home']}-{parsed['away']}",
-                "sport": "basketball",
-                "league": "NBA",
-                "home_team": parsed['home'],
-                "away_team": parsed['away'],
-                "sportsbook": "User Input",
-                "moneyline": {"home": parsed['home_odds'], "away": parsed['away_odds']}
-            }
+            event_id = f"chat-{parsed['home']}-{parsed['away']}"
+
+            odds_data = self._odds_template.copy()
+            odds_data.update(
+                event_id=event_id,
+                home_team=parsed['home'],
+                away_team=parsed['away'],
+                moneyline={"home": parsed['home_odds'], "away": parsed['away_odds']}
+            )
 
             forecast_data = {
-                "event_id": f"chat-{parsed['home']}-{parsed['away']}",
+                "event_id": event_id,
                 "p_model": {"home": parsed['home_prob'], "away": parsed['away_prob']}
             }
 
-            report = self.workflow.run(odds_data, forecast_data)
-            self.window.after(0, lambda: self.display_results(report, parsed))
+            report = await asyncio.to_thread(self.workflow.run, odds_data, forecast_data)
+
+            self._result_cache[key] = report
+            if len(self._result_cache) > self.MAX_CACHED_RESULTS:
+                self._result_cache.popitem(last=False)
+
+            self._post("results", report, parsed)
 
         except Exception as e:
-            self.window.after(0, lambda: self.add_message("ai", f"Error: {str(e)}"))
-            self.window.after(0, lambda: self.status_label.config(text="Error during analysis"))
+            self._post("message", "ai", f"Error: {str(e)}")
+            self._post("status", "Error during analysis")
         finally:
-            self.window.after(0, self.reset_input)
-
-    def parse_message(self, message):
-        """Parse user message"""
-        try:
-            message = message.lower()
+            self._in_flight -= 1
+            self._post("reset_input")
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def parse_message(message):
+        """Parse user message (cached; callers must not mutate the result)"""
+        message = message.strip()
+        if not message:
+            return None
 
-            # Extract teams
-            if " vs " in message or " v " in message:
-                parts = message.replace(" v ", " vs ").split(" vs ")
-                home = parts[0].strip().title()
-                away = parts[1].split(",")[0].strip().title()
-            else:
-                words = message.split()
-                home = words[0].title() if len(words) > 0 else "Home"
-                away = words[1].title() if len(words) > 1 else "Away"
-
-            # Extract odds
-            import re
-            odds_pattern = r"[-+]\d+"
-            odds = re.findall(odds_pattern, message)
-
-            if len(odds) >= 2:
-                home_odds = int(odds[0])
-                away_odds = int(odds[1])
+        # Extract teams, keeping the casing the user typed
+        match = _VS_RE.search(message)
+        if match:
+            home = message[:match.start()].strip()
+            away, comma, rest = message[match.end():].partition(",")
+            away = away.strip()
+            if not comma:
+                # No comma: the numbers follow the away team directly
+                number = _NUMBER_RE.search(away)
+                if number:
+                    away, rest = away[:number.start()].strip(), away[number.start():]
+        else:
+            words = _NAME_RE.findall(message)
+            home = words[0] if len(words) > 0 else "Home"
+            away = words[1] if len(words) > 1 else "Away"
+            rest = message
+
+        # Extract odds and probability in a single scan past the matchup,
+        # so digits in team names ("76ers") are not read as numbers
+        odds = []
+        probs = []
+        for match in _NUMBER_RE.finditer(rest):
+            if match.group("odds"):
+                odds.append(int(match.group("odds")))
             else:
-                home_odds = -150
-                away_odds = +130
+                probs.append(int(match.group("pct")))
 
-            # Extract probability
-            prob_pattern = r"(\d+)%?"
-            probs = re.findall(prob_pattern, message)
-
-            if probs:
-                home_prob = float(probs[-1]) / 100
-                home_prob = max(0.01, min(0.99, home_prob))
-            else:
-                home_prob = 0.55
+        if len(odds) >= 2:
+            home_odds, away_odds = odds[0], odds[1]
+        else:
+            home_odds = -150
+            away_odds = +130
 
-            away_prob = 1.0 - home_prob
+        if probs:
+            home_prob = max(0.01, min(0.99, probs[-1] / 100))
+        else:
+            home_prob = 0.55
 
-            return {
-                "home": home,
-                "away": away,
-                "home_odds": home_odds,
-                "away_odds": away_odds,
-                "home_prob": home_prob,
-                "away_prob": away_prob
-            }
+        away_prob = 1.0 - home_prob
 
-        except Exception:
-            return None
+        return {
+            "home": home,
+            "away": away,
+            "home_odds": home_odds,
+            "away_odds": away_odds,
+            "home_prob": home_prob,
+            "away_prob": away_prob
+        }
 
     def display_results(self, report, parsed):
         """Display analysis results"""
-        self.add_message("ai", "Analysis complete. Here are the details:")
+        # Agent insights share one bubble with the header
+        details = ["Analysis complete. Here are the details:"]
 
         # Show LLM insights if available
         if 'llm_insights' in report:
             insights = report['llm_insights']
 
             if insights.get('odds_analysis') and insights['odds_analysis'] != "Analyzed odds and removed vig using standard mathematical formulas.":
-                self.add_message("ai", f"OddsAnalyzer: {insights['odds_analysis']}")
+                details.append(f"OddsAnalyzer: {insights['odds_analysis']}")
 
             if insights.get('forecast_evaluation') and insights['forecast_evaluation'] != "Forecast validated. Probabilities sum to 100% and are within valid ranges.":
-                self.add_message("ai", f"ForecastEvaluator: {insights['forecast_evaluation']}")
+                details.append(f"ForecastEvaluator: {insights['forecast_evaluation']}")
 
             if insights.get('edge_insight') and insights['edge_insight'] != "Edge calculated. Positive edges indicate potential betting value.":
-                self.add_message("ai", f"EdgeCalculator: {insights['edge_insight']}")
-
-        # Fair odds
-        fair_home = report["fair_probabilities"]["home"]
-        fair_away = report["fair_probabilities"]["away"]
-        self.add_message(
-            "result",
-            f"Fair odds (vig removed):\n{parsed['home']}: {fair_home:.1%}\n{parsed['away']}: {fair_away:.1%}"
-        )
-
-        # Model prediction
-        model_home = report["model_probabilities"]["home"]
-        model_away = report["model_probabilities"]["away"]
-        self.add_message(
-            "result",
-            f"Your prediction:\n{parsed['home']}: {model_home:.1%}\n{parsed['away']}: {model_away:.1%}"
-        )
-
-        # Edge
-        home_edge = report["edge_analysis"]["edge_pct"]["home"]
-        away_edge = report["edge_analysis"]["edge_pct"]["away"]
-        self.add_message(
-            "result",
-            f"Betting edge:\n{parsed['home']}: {home_edge:+.2f}%\n{parsed['away']}: {away_edge:+.2f}%"
-        )
+                details.append(f"EdgeCalculator: {insights['edge_insight']}")
+
+        # Numbers go to the summary panel, updated in place
+        fair = report["fair_probabilities"]
+        model = report["model_probabilities"]
+        edge = report["edge_analysis"]["edge_pct"]
+        for side in ("home", "away"):
+            team = parsed[side]
+            self._summary_labels["fair", side].config(text=f"{team}: {fair[side]:.1%}")
+            self._summary_labels["model", side].config(text=f"{team}: {model[side]:.1%}")
+            self._summary_labels["edge", side].config(text=f"{team}: {edge[side]:+.2f}%")
+        if not self.summary_panel.winfo_manager():
+            self.summary_panel.pack(fill="x", side="bottom", padx=10, pady=(4, 0))
+
+        msgs = [("ai", "\n\n".join(details))]
 
         # Recommendation
         if 'llm_recommendation' in report and report['llm_recommendation'] != "Recommendation generated based on edge thresholds and risk management.":
-            self.add_message("recommendation", report['llm_recommendation'])
+            msgs.append(("recommendation", report['llm_recommendation']))
         else:
-            rec = report["recommendation"]
-            self.add_message("recommendation", rec)
+            msgs.append(("recommendation", report["recommendation"]))
 
-        self.add_message("system", "Reminder: Bet responsibly.")
+        msgs.append(("system", "Reminder: Bet responsibly."))
+        self.add_messages_batch(msgs)
 
         # Update examples
         self.show_examples([
@@ -557,8 +680,7 @@ class ChatbotFixed:
         if self.workflow is None:
             self.add_message("system", "Agents still loading...")
             return
-        self.input_field.delete(0, tk.END)
-        self.input_field.insert(0, "Lakers vs Celtics, Lakers -140, Celtics +120, Lakers 62%")
+        self._input_var.set("Lakers vs Celtics, Lakers -140, Celtics +120, Lakers 62%")
         self.send_message()
 
     def run(self):
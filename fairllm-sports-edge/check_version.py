@@ -5,16 +5,24 @@ Check which version of agentic_workflow you have
 import sys
 sys.path.insert(0, 'src')
 
+import inspect
+
 print("Checking your agentic_workflow.py version...\n")
 
 try:
-    from fairllm_agent.agentic_workflow import SportsEdgeFlow
-    
-    # Check if it has LLM capabilities
-    workflow = SportsEdgeFlow()
-    
+    from fairllm_agent import agentic_workflow
+
+    # Inspect the agent classes instead of building the workflow, so no models load
+    agent_classes = [
+        obj for obj in vars(agentic_workflow).values()
+        if inspect.isclass(obj)
+        and issubclass(obj, agentic_workflow.Agent)
+        and obj is not agentic_workflow.Agent
+        and obj.__module__ == agentic_workflow.__name__
+    ]
+
     # Check if agents have LLM methods
-    if hasattr(workflow.agents[0], 'invoke_llm'):
+    if agent_classes and hasattr(agent_classes[0], 'invoke_llm'):
         print("✅ You have the LLM VERSION!")
         print("   Your agentic_workflow.py includes Phi-3-mini integration")
         print("\nYou're all set! You can:")
@@ -25,11 +33,11 @@ try:
         print("   This is fast but doesn't use LLMs")
         print("\n📥 You need to download: agentic_workflow_llm.py")
         print("   And import from it instead")
-        
+
     print("\n" + "="*60)
-    print("Agents loaded:", [a.name for a in workflow.agents])
+    print("Agents found:", [cls.__name__ for cls in agent_classes])
     print("="*60)
-    
+
 except Exception as e:
     print(f"❌ Error: {e}")
     print("\nTroubleshooting:")
@@ -3,18 +3,28 @@
 Demo script showing the FairLLM Sports Edge Analysis system
 Demonstrates the full agentic workflow with clear output
 """
+import argparse
 import json
 import sys
 import os
+from functools import lru_cache
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+import numpy as np
 from rich.console import Console
 from rich.panel import Panel
 from rich.markdown import Markdown
 from fairllm_agent.agentic_workflow import SportsEdgeFlow
+from fairllm_agent.probability_calc import compute_edge_batch, fair_probs_cache_info
 
 console = Console()
 
 
+@lru_cache(maxsize=1)
+def _get_workflow() -> SportsEdgeFlow:
+    """One workflow shared by every demo"""
+    return SportsEdgeFlow()
+
+
 def print_section(title: str):
     """Print a section header"""
     console.print(f"\n[bold cyan]{'='*70}[/bold cyan]")
@@ -47,7 +57,7 @@ def demo_single_game():
     console.print(f"[yellow]Model Prediction:[/yellow] Lakers {forecast_data['p_model']['home']:.1%}, Celtics {forecast_data['p_model']['away']:.1%}\n")
     
     console.print("[cyan]Initializing multi-agent workflow...[/cyan]")
-    workflow = SportsEdgeFlow()
+    workflow = _get_workflow()
     
     console.print("[cyan]Agents loaded:[/cyan]")
     console.print("  • OddsAnalyzerAgent")
@@ -164,34 +174,35 @@ def demo_batch_processing():
     
     console.print("[cyan]Processing 5 games across NBA, NFL, and NHL...[/cyan]\n")
     
-    workflow = SportsEdgeFlow()
-    reports = workflow.run_batch(games)
+    workflow = _get_workflow()
+    # Tally reports as they stream out; the ranking below works from the input arrays
+    total = bet_count = 0
+    for report in workflow.iter_batch(games):
+        total += 1
+        bet_count += "RECOMMENDED BET" in report['recommendation']
     
     console.print(f"[green]Batch processing complete![/green]\n")
     console.print(f"[yellow]Summary:[/yellow]")
-    console.print(f"  Total games analyzed: {len(reports)}")
-    
-    bet_count = sum(1 for r in reports if "RECOMMENDED BET" in r['recommendation'])
+    console.print(f"  Total games analyzed: {total}")
     console.print(f"  Recommended bets: {bet_count}")
-    console.print(f"  Pass recommendations: {len(reports) - bet_count}\n")
+    console.print(f"  Pass recommendations: {total - bet_count}\n")
     
     console.print("[yellow]Top Opportunities:[/yellow]")
     
-    # Sort by max edge
-    sorted_reports = sorted(
-        reports,
-        key=lambda r: max(r['edge_analysis']['edge_pct']['home'], 
-                         r['edge_analysis']['edge_pct']['away']),
-        reverse=True
-    )
+    # Edges for the whole slate in array ops, ranked by the better side
+    home_ml = np.array([odds['moneyline']['home'] for odds, _ in games])
+    away_ml = np.array([odds['moneyline']['away'] for odds, _ in games])
+    p_home = np.array([forecast['p_model']['home'] for _, forecast in games])
+    _, _, edge_home, edge_away = compute_edge_batch(home_ml, away_ml, p_home)
+    best_edge = np.maximum(edge_home, edge_away)
     
-    for i, report in enumerate(sorted_reports[:3], 1):
-        matchup = f"{report['matchup']['home']} vs {report['matchup']['away']}"
-        edge_pct = report['edge_analysis']['edge_pct']
-        best_edge = max(edge_pct['home'], edge_pct['away'])
-        console.print(f"  {i}. {matchup} - {best_edge:+.2f}% edge")
+    for i, idx in enumerate(np.argsort(-best_edge)[:3], 1):
+        odds = games[idx][0]
+        matchup = f"{odds['home_team']} vs {odds['away_team']}"
+        console.print(f"  {i}. {matchup} - {best_edge[idx]:+.2f}% edge")
     
-    return reports
+    info = fair_probs_cache_info()
+    console.print(f"\n[dim]Fair-odds cache: {info.hits} hits, {info.misses} misses[/dim]")
 
 
 def demo_agent_insights():
@@ -213,7 +224,7 @@ def demo_agent_insights():
         "p_model": {"home": 0.55, "away": 0.45}
     }
     
-    workflow = SportsEdgeFlow()
+    workflow = _get_workflow()
     
     # Step through each agent
     console.print("[bold]Step 1: OddsAnalyzerAgent[/bold]")
@@ -254,6 +265,13 @@ def demo_agent_insights():
 
 def main():
     """Run all demos"""
+    parser = argparse.ArgumentParser(description="FairLLM Sports Edge Analysis demo")
+    parser.add_argument(
+        "--no-pause", action="store_true",
+        help="run all demos without waiting for Enter in between (scripted/CI runs)"
+    )
+    args = parser.parse_args()
+    
     console.print("\n[bold magenta]╔═══════════════════════════════════════════════════════════╗[/bold magenta]")
     console.print("[bold magenta]║   FairLLM Sports Edge Analysis - System Demonstration    ║[/bold magenta]")
     console.print("[bold magenta]║          Multi-Agent Betting Edge Calculator             ║[/bold magenta]")
@@ -261,11 +279,13 @@ def main():
     
     # Demo 1
     demo_single_game()
-    input("\nPress Enter to continue to Demo 2...")
+    if not args.no_pause:
+        input("\nPress Enter to continue to Demo 2...")
     
     # Demo 2
     demo_batch_processing()
-    input("\nPress Enter to continue to Demo 3...")
+    if not args.no_pause:
+        input("\nPress Enter to continue to Demo 3...")
     
     # Demo 3
     demo_agent_insights()
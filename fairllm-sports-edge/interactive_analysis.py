@@ -2,6 +2,7 @@
 """
 Interactive Sports Edge Analysis
 """
+import argparse
 import sys
 sys.path.insert(0, 'src')
 
@@ -10,10 +11,30 @@ from rich.prompt import Prompt, IntPrompt, Confirm
 from rich.panel import Panel
 from rich.table import Table
 from fairllm_agent.agentic_workflow import SportsEdgeFlow
+from fairllm_agent.probability_calc import fair_probs_cache_info
 
 console = Console()
 
 def main():
+    parser = argparse.ArgumentParser(description="Interactive Sports Edge Analysis")
+    parser.add_argument(
+        "--input-file",
+        help="text file with one answer per line, fed to the prompts instead of the keyboard"
+    )
+    args = parser.parse_args()
+    if not args.input_file:
+        run_session()
+        return
+
+    # The prompts read through input(), which reads sys.stdin
+    with open(args.input_file, encoding="utf-8") as answers:
+        sys.stdin = answers
+        try:
+            run_session()
+        finally:
+            sys.stdin = sys.__stdin__
+
+def run_session():
     console.print(Panel.fit(
         "[bold magenta]Interactive Sports Edge Analysis[/bold magenta]\n"
         "Multi-Agent Betting Edge Calculator",
@@ -96,7 +117,8 @@ def main():
             if not Confirm.ask("Analyze another game?", default=True):
                 break
                 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
+            # EOFError: a piped or --input-file session ran out of answers
             console.print("\n\n[yellow]Exiting...[/yellow]")
             break
         except Exception as e:
@@ -104,6 +126,8 @@ def main():
             if not Confirm.ask("\nTry again?", default=True):
                 break
     
+    info = fair_probs_cache_info()
+    console.print(f"\n[dim]Fair-odds cache: {info.hits} hits, {info.misses} misses[/dim]")
     console.print("\n[cyan]Thanks for using Sports Edge Analysis![/cyan]\n")
 
 def show_upcoming_games(sport):
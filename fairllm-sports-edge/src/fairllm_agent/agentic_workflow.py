@@ -3,7 +3,8 @@ Agentic Workflow for Sports Edge Analysis
 Uses FairLLM framework to coordinate multiple specialized agents
 """
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 import json
 
 # Mock Fair classes if FairLLM not available
@@ -124,10 +125,10 @@ class EdgeCalculatorAgent(Agent):
         Returns:
             Dictionary with edge calculations
         """
-        e = edge(model_p, fair_p)
+        e = edge(model_p, fair_p)  # already in percentage points
         
         # Determine if there's a betting opportunity (edge > threshold)
-        threshold = 0.02  # 2% edge required
+        threshold = 2.0  # 2% edge required
         opportunities = []
         
         for side in ["home", "away"]:
@@ -135,22 +136,22 @@ class EdgeCalculatorAgent(Agent):
                 opportunities.append({
                     "side": side,
                     "edge": e[side],
-                    "edge_pct": e[side] * 100,
+                    "edge_pct": e[side],
                     "recommendation": "BET",
-                    "confidence": "HIGH" if e[side] > 0.05 else "MEDIUM"
+                    "confidence": "HIGH" if e[side] > 5.0 else "MEDIUM"
                 })
             elif e[side] < -threshold:
                 opportunities.append({
                     "side": side,
                     "edge": e[side],
-                    "edge_pct": e[side] * 100,
+                    "edge_pct": e[side],
                     "recommendation": "AVOID",
                     "confidence": "HIGH"
                 })
         
         return {
             "edge": e,
-            "edge_pct": {k: round(100.0 * v, 2) for k, v in e.items()},
+            "edge_pct": {k: round(v, 2) for k, v in e.items()},
             "opportunities": opportunities,
             "has_positive_edge": any(e[side] > threshold for side in ["home", "away"]),
             "analysis": self._generate_edge_analysis(e, opportunities)
@@ -304,23 +305,38 @@ class SportsEdgeFlow(Flow):
         
         return final_report
     
-    def run_batch(self, games: List[tuple[Dict[str, Any], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    def run_batch(self, games: List[tuple[Dict[str, Any], Dict[str, Any]]],
+                  max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Process multiple games in batch
         
         Args:
             games: List of (odds_data, forecast_data) tuples
+            max_workers: Run games on this many threads. The rule-based agents are
+                pure Python, so leave it unset unless the agents block (I/O, LLM calls)
             
         Returns:
-            List of analysis reports
+            List of analysis reports, in input order (games that fail are skipped)
         """
-        reports = []
-        for odds_data, forecast_data in games:
-            try:
-                report = self.run(odds_data, forecast_data)
-                reports.append(report)
-            except Exception as e:
-                print(f"Error processing game {odds_data.get('event_id')}: {e}")
-                continue
+        if max_workers is None or max_workers <= 1 or len(games) <= 1:
+            return list(self.iter_batch(games))
         
-        return reports
\ No newline at end of file
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(games))) as executor:
+            results = list(executor.map(self._try_run, games))
+        return [report for report in results if report is not None]
+    
+    def iter_batch(self, games: Iterable[tuple[Dict[str, Any], Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+        """Like run_batch, but yields each report as it is produced instead of building a list"""
+        for game in games:
+            report = self._try_run(game)
+            if report is not None:
+                yield report
+    
+    def _try_run(self, game: tuple[Dict[str, Any], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Run one game, reporting and swallowing its error"""
+        odds_data, forecast_data = game
+        try:
+            return self.run(odds_data, forecast_data)
+        except Exception as e:
+            print(f"Error processing game {odds_data.get('event_id')}: {e}")
+            return None
\ No newline at end of file
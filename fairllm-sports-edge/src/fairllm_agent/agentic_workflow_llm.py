@@ -3,7 +3,8 @@ LLM-Powered Agentic Workflow for Sports Edge Analysis
 Uses Phi-3-mini for agent reasoning and decision-making
 """
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, Optional, AsyncIterator
+import asyncio
 import json
 
 from .fair_framework import Agent, Flow, LLMConfig
@@ -26,12 +27,14 @@ Always provide clear, concise explanations of the mathematical reasoning."""
         """Rule-based fallback when LLM unavailable"""
         return "Analyzed odds and removed vig using standard mathematical formulas."
     
-    def run(self, odds_data: Dict[str, Any]) -> Dict[str, Any]:
+    def run(self, odds_data: Dict[str, Any],
+            on_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
         Analyze odds using LLM reasoning combined with mathematical calculation
         
         Args:
             odds_data: Dictionary containing sportsbook odds information
+            on_text: Optional callback for streamed LLM text
             
         Returns:
             Dictionary with fair probabilities and LLM analysis
@@ -54,7 +57,7 @@ The fair probabilities after removing vig are:
 
 Explain in 1-2 sentences why removing the vig is important for finding betting value."""
         
-        llm_analysis = self.invoke_llm(llm_prompt, max_tokens=150)
+        llm_analysis = self.invoke_llm(llm_prompt, max_tokens=150, on_text=on_text)
         
         return {
             "event_id": odds_data.get("event_id"),
@@ -79,12 +82,14 @@ Provide brief, insightful commentary on forecast quality."""
     def _fallback_response(self, prompt: str) -> str:
         return "Forecast validated. Probabilities sum to 100% and are within valid ranges."
     
-    def run(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def run(self, data: Dict[str, Any],
+            on_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
         Evaluate forecast using LLM reasoning
         
         Args:
             data: Combined odds analysis and forecast data
+            on_text: Optional callback for streamed LLM text
             
         Returns:
             Data with LLM evaluation added
@@ -105,7 +110,7 @@ Provide brief, insightful commentary on forecast quality."""
 
 In 1-2 sentences, assess whether this forecast appears reasonable and if there's significant disagreement with the market."""
         
-        llm_evaluation = self.invoke_llm(llm_prompt, max_tokens=150)
+        llm_evaluation = self.invoke_llm(llm_prompt, max_tokens=150, on_text=on_text)
         
         return {
             **odds_analysis,
@@ -131,12 +136,14 @@ Provide clear insights on edge magnitude and opportunity quality."""
     def _fallback_response(self, prompt: str) -> str:
         return "Edge calculated. Positive edges indicate potential betting value."
     
-    def run(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def run(self, data: Dict[str, Any],
+            on_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
         Calculate edge using LLM reasoning
         
         Args:
             data: Combined analysis with odds and forecast
+            on_text: Optional callback for streamed LLM text
             
         Returns:
             Data with edge analysis and LLM insights
@@ -161,7 +168,7 @@ Professional bettors typically look for edges above 2%.
 
 In 2-3 sentences, assess: (1) Is this a strong betting opportunity? (2) Which side has value? (3) What's your confidence level?"""
         
-        llm_insight = self.invoke_llm(llm_prompt, max_tokens=200)
+        llm_insight = self.invoke_llm(llm_prompt, max_tokens=200, on_text=on_text)
         
         return {
             **data,
@@ -188,12 +195,14 @@ Always explain your reasoning clearly and state confidence levels."""
     def _fallback_response(self, prompt: str) -> str:
         return "Recommendation generated based on edge thresholds and risk management."
     
-    def run(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def run(self, data: Dict[str, Any],
+            on_text: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
         Generate recommendation using LLM reasoning
         
         Args:
             data: Complete analysis with edges
+            on_text: Optional callback for streamed LLM text
             
         Returns:
             Final report with LLM-powered recommendation
@@ -233,7 +242,7 @@ Then add one sentence explaining the reasoning."""
 
 Write: "PASS - No edges above 2% threshold" then explain why in one sentence."""
         
-        llm_recommendation = self.invoke_llm(llm_prompt, max_tokens=150)
+        llm_recommendation = self.invoke_llm(llm_prompt, max_tokens=150, on_text=on_text)
         
         # Build final report using correct function signature
         edge_reports = build_edge_reports(
@@ -283,9 +292,12 @@ class LLMSportsEdgeFlow(Flow):
     Main flow coordinator using LLM-powered agents
     """
     
-    def __init__(self):
+    def __init__(self, max_concurrent_llm_calls: int = 4):
         super().__init__("LLM-SportsEdgeFlow")
         
+        # Upper bound on agent LLM calls in flight at once (see run_async)
+        self.max_concurrent_llm_calls = max_concurrent_llm_calls
+        
         # Initialize LLM-powered agents
         self.odds_analyzer = LLMOddsAnalyzerAgent()
         self.forecast_evaluator = LLMForecastEvaluatorAgent()
@@ -300,6 +312,11 @@ class LLMSportsEdgeFlow(Flow):
             self.report_generator
         ]
     
+    def warmup(self):
+        """Load every agent's model and system-prompt cache now so the next analysis doesn't pay for it"""
+        for agent in self.agents:
+            agent.warmup()
+    
     def run(self, odds_data: Dict[str, Any], forecast_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute the LLM-powered agentic workflow
@@ -329,10 +346,7 @@ class LLMSportsEdgeFlow(Flow):
         edge_data = self.edge_calculator.run(evaluated_data)
         
         # Add original data fields needed by report generator
-        edge_data['sport'] = odds_data.get('sport', 'unknown')
-        edge_data['league'] = odds_data.get('league', 'unknown')
-        edge_data['home_team'] = odds_data.get('home_team', 'Home')
-        edge_data['away_team'] = odds_data.get('away_team', 'Away')
+        self._add_matchup_fields(edge_data, odds_data)
         
         # Step 4: Generate recommendation with LLM
         final_report = self.report_generator.run(edge_data)
@@ -341,6 +355,148 @@ class LLMSportsEdgeFlow(Flow):
         print(f"{'='*70}\n")
         
         return final_report
+    
+    async def run_async(self, odds_data: Dict[str, Any], forecast_data: Dict[str, Any],
+                        semaphore: asyncio.Semaphore | None = None,
+                        on_event: Optional[Callable[[str, str, Optional[str]], None]] = None) -> Dict[str, Any]:
+        """
+        Execute the workflow, overlapping LLM calls that don't depend on each other
+        
+        The OddsAnalyzer, ForecastEvaluator and EdgeCalculator prompts only need the
+        vig-free and model probabilities, which are cheap to compute up front, so
+        those three LLM calls run concurrently. ReportGenerator runs last.
+        
+        Args:
+            odds_data: Sportsbook odds information
+            forecast_data: Model predictions
+            semaphore: Optional limit on concurrent LLM calls (shared across games in batch mode)
+            on_event: Optional callback receiving ("text", agent_name, chunk) from
+                worker threads while an agent generates, and ("done", agent_name, None)
+                once it finishes
+            
+        Returns:
+            Complete analysis report with LLM insights (same shape as run())
+        """
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent_llm_calls)
+        
+        print(f"\n{'='*70}")
+        print(f"[{self.name}] Starting LLM-powered analysis (concurrent)...")
+        print(f"{'='*70}\n")
+        
+        moneyline = odds_data.get('moneyline', {})
+        market = {
+            'fair_probabilities': fair_probs_from_moneyline(moneyline.get('home'), moneyline.get('away'))
+        }
+        
+        # Steps 1-3: Analyze odds, evaluate forecast and calculate edge in parallel
+        odds_analysis, forecast_eval, edge_result = await asyncio.gather(
+            self._run_agent(semaphore, self.odds_analyzer, odds_data, on_event),
+            self._run_agent(semaphore, self.forecast_evaluator, {
+                'odds_analysis': market,
+                'forecast': forecast_data
+            }, on_event),
+            self._run_agent(semaphore, self.edge_calculator, {
+                **market,
+                'model_probabilities': forecast_data.get('p_model', {})
+            }, on_event)
+        )
+        edge_data = {**odds_analysis, **forecast_eval, **edge_result}
+        self._add_matchup_fields(edge_data, odds_data)
+        
+        # Step 4: Generate recommendation with LLM
+        final_report = await self._run_agent(semaphore, self.report_generator, edge_data, on_event)
+        
+        print(f"\n[{self.name}] Analysis complete!")
+        print(f"{'='*70}\n")
+        
+        return final_report
+    
+    async def astream(self, odds_data: Dict[str, Any],
+                      forecast_data: Dict[str, Any]) -> AsyncIterator[tuple[str, Optional[str], Any]]:
+        """
+        Run the workflow, yielding agent output as it is generated
+        
+        Yields ("text", agent_name, chunk) and ("done", agent_name, None) events
+        in arrival order, then a final ("report", None, report).
+        """
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+        
+        def on_event(kind: str, agent_name: str, chunk: Optional[str]):
+            loop.call_soon_threadsafe(events.put_nowait, (kind, agent_name, chunk))
+        
+        task = asyncio.create_task(self.run_async(odds_data, forecast_data, on_event=on_event))
+        task.add_done_callback(lambda _: events.put_nowait(("finished", None, None)))
+        
+        while True:
+            event = await events.get()
+            if event[0] == "finished":
+                break
+            yield event
+        
+        yield "report", None, task.result()
+    
+    def run_batch(self, games: List[tuple[Dict[str, Any], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Process multiple games, overlapping their LLM calls
+        
+        Args:
+            games: List of (odds_data, forecast_data) tuples
+            
+        Returns:
+            List of analysis reports (games that fail are skipped)
+        """
+        # A single game gains nothing from the event loop setup
+        if len(games) == 1:
+            odds_data, forecast_data = games[0]
+            try:
+                return [self.run(odds_data, forecast_data)]
+            except Exception as e:
+                print(f"Error processing game {odds_data.get('event_id')}: {e}")
+                return []
+        
+        return asyncio.run(self.run_batch_async(games))
+    
+    async def run_batch_async(self, games: List[tuple[Dict[str, Any], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Async version of run_batch; all games share one LLM semaphore"""
+        semaphore = asyncio.Semaphore(self.max_concurrent_llm_calls)
+        results = await asyncio.gather(
+            *(self.run_async(odds_data, forecast_data, semaphore) for odds_data, forecast_data in games),
+            return_exceptions=True
+        )
+        
+        reports = []
+        for (odds_data, _), result in zip(games, results):
+            if isinstance(result, Exception):
+                print(f"Error processing game {odds_data.get('event_id')}: {result}")
+                continue
+            reports.append(result)
+        
+        return reports
+    
+    @staticmethod
+    async def _run_agent(semaphore: asyncio.Semaphore, agent: Agent, data: Dict[str, Any],
+                         on_event: Optional[Callable[[str, str, Optional[str]], None]] = None) -> Dict[str, Any]:
+        """Run a blocking agent step on a worker thread, bounded by the LLM semaphore"""
+        on_text = None
+        if on_event is not None:
+            on_text = lambda chunk: on_event("text", agent.name, chunk)
+        
+        async with semaphore:
+            result = await asyncio.to_thread(agent.run, data, on_text)
+        
+        if on_event is not None:
+            on_event("done", agent.name, None)
+        return result
+    
+    @staticmethod
+    def _add_matchup_fields(edge_data: Dict[str, Any], odds_data: Dict[str, Any]):
+        """Copy the original game fields needed by the report generator"""
+        edge_data['sport'] = odds_data.get('sport', 'unknown')
+        edge_data['league'] = odds_data.get('league', 'unknown')
+        edge_data['home_team'] = odds_data.get('home_team', 'Home')
+        edge_data['away_team'] = odds_data.get('away_team', 'Away')
 
 
 # Keep backward compatibility with original implementation
@@ -2,8 +2,9 @@
 FairLLM-Inspired Agent Framework with Phi-3-mini
 Implements Agent and Flow patterns with actual LLM reasoning
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable
 import json
+import threading
 from abc import ABC, abstractmethod
 
 
@@ -27,9 +28,21 @@ class Agent(ABC):
         self.system_prompt = ""
         self._model = None
         self._tokenizer = None
+        self._load_lock = threading.Lock()
+        
+        # KV cache of the (fixed) system prompt, reused across calls
+        self.use_prefix_cache = True
+        self._prefix_ids = None
+        self._prefix_cache = None
     
     def _load_model(self):
         """Lazy load the LLM model"""
+        # Agents may be invoked from worker threads, so only one thread loads the model
+        with self._load_lock:
+            self._load_model_locked()
+    
+    def _load_model_locked(self):
+        """Load the model (caller must hold _load_lock)"""
         if self._model is None:
             try:
                 from transformers import AutoModelForCausalLM, AutoTokenizer
@@ -51,13 +64,15 @@ class Agent(ABC):
                 print(f"[{self.name}] Falling back to rule-based processing")
                 self._model = None
     
-    def invoke_llm(self, prompt: str, max_tokens: int = 500) -> str:
+    def invoke_llm(self, prompt: str, max_tokens: int = 500,
+                   on_text: Optional[Callable[[str], None]] = None) -> str:
         """
         Invoke the LLM with a prompt
         
         Args:
             prompt: Input prompt for the LLM
             max_tokens: Maximum tokens to generate
+            on_text: Optional callback receiving text chunks as they are generated
             
         Returns:
             LLM response text
@@ -66,7 +81,10 @@ class Agent(ABC):
         
         if self._model is None:
             # Fallback: return a structured response without LLM
-            return self._fallback_response(prompt)
+            response = self._fallback_response(prompt)
+            if on_text is not None:
+                on_text(response)
+            return response
         
         try:
             # Format prompt with system message
@@ -76,7 +94,7 @@ class Agent(ABC):
             if self._model.device.type == "cuda":
                 inputs = {k: v.to(self._model.device) for k, v in inputs.items()}
             
-            outputs = self._model.generate(
+            generate_kwargs = dict(
                 **inputs,
                 max_new_tokens=max_tokens,
                 do_sample=True,
@@ -85,13 +103,105 @@ class Agent(ABC):
                 pad_token_id=self._tokenizer.eos_token_id
             )
             
-            response = self._tokenizer.decode(outputs[0][inputs['input_ids'].shape[1]:], skip_special_tokens=True)
-            return response.strip()
+            prefix_cache = self._get_prefix_cache(inputs['input_ids'])
+            if prefix_cache is None:
+                return self._generate(generate_kwargs, on_text)
+            
+            try:
+                return self._generate({**generate_kwargs, 'past_key_values': prefix_cache}, on_text)
+            except Exception as e:
+                print(f"[{self.name}] Prefix cache unsupported ({e}), disabling it")
+                self.use_prefix_cache = False
+                return self._generate(generate_kwargs, on_text)
             
         except Exception as e:
             print(f"[{self.name}] LLM invocation error: {e}")
             return self._fallback_response(prompt)
     
+    def _generate(self, generate_kwargs: Dict[str, Any], on_text: Optional[Callable[[str], None]]) -> str:
+        """Run generation and return the decoded completion"""
+        if on_text is not None:
+            return self._stream_generate(generate_kwargs, on_text).strip()
+        
+        outputs = self._model.generate(**generate_kwargs)
+        
+        response = self._tokenizer.decode(outputs[0][generate_kwargs['input_ids'].shape[1]:], skip_special_tokens=True)
+        return response.strip()
+    
+    def _get_prefix_cache(self, input_ids):
+        """
+        Return a fresh copy of the system prompt's KV cache, or None if it can't be used
+        
+        The system prompt is the same on every call, so its prefill is computed once
+        and generate() only has to process the per-call part of the prompt.
+        """
+        if not self._build_prefix_cache():
+            return None
+        
+        import copy
+        import torch
+        
+        # Only valid if the full prompt tokenizes to the cached prefix followed by more tokens
+        n = self._prefix_ids.shape[1]
+        if input_ids.shape[1] <= n or not torch.equal(input_ids[0, :n], self._prefix_ids[0]):
+            return None
+        
+        return copy.deepcopy(self._prefix_cache)
+    
+    def _build_prefix_cache(self) -> bool:
+        """Prefill the system prompt once; returns whether a prefix cache is available"""
+        if not self.use_prefix_cache or not self.system_prompt or self._model is None:
+            return False
+        
+        import torch
+        
+        with self._load_lock:
+            if self._prefix_cache is None:
+                try:
+                    prefix = self._tokenizer(f"{self.system_prompt}\n\n", return_tensors="pt")
+                    prefix = {k: v.to(self._model.device) for k, v in prefix.items()}
+                    with torch.no_grad():
+                        self._prefix_cache = self._model(**prefix, use_cache=True).past_key_values
+                    self._prefix_ids = prefix['input_ids']
+                except Exception as e:
+                    print(f"[{self.name}] Could not build prefix cache ({e}), disabling it")
+                    self.use_prefix_cache = False
+                    return False
+        return True
+    
+    def warmup(self):
+        """Load the model and prefill the system prompt ahead of the first call"""
+        self._load_model()
+        self._build_prefix_cache()
+    
+    def _stream_generate(self, generate_kwargs: Dict[str, Any], on_text: Callable[[str], None]) -> str:
+        """Run generate() on a helper thread and forward decoded text as it arrives"""
+        from transformers import TextIteratorStreamer
+        
+        streamer = TextIteratorStreamer(self._tokenizer, skip_prompt=True, skip_special_tokens=True)
+        errors = []
+        
+        def generate():
+            try:
+                self._model.generate(**generate_kwargs, streamer=streamer)
+            except Exception as e:
+                errors.append(e)
+                streamer.end()
+        
+        thread = threading.Thread(target=generate, daemon=True)
+        thread.start()
+        
+        chunks = []
+        for chunk in streamer:
+            if chunk:
+                chunks.append(chunk)
+                on_text(chunk)
+        thread.join()
+        
+        if errors:
+            raise errors[0]
+        return "".join(chunks)
+    
     @abstractmethod
     def _fallback_response(self, prompt: str) -> str:
         """Fallback response when LLM is unavailable"""
@@ -1,6 +1,9 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Dict
 
+import numpy as np
+
 def american_to_implied_prob(odds: int) -> float:
     if odds > 0:
         return 100.0 / (odds + 100.0)
@@ -13,8 +16,30 @@ def remove_two_way_vig(p_home_inc_vig: float, p_away_inc_vig: float) -> tuple[fl
         raise ValueError("Invalid implied probabilities.")
     return (p_home_inc_vig / s, p_away_inc_vig / s)
 
+@lru_cache(maxsize=1024)
+def _fair_probs(home_ml: int, away_ml: int) -> tuple[float, float]:
+    """Vig-free (home, away); books quote a small set of lines, so repeats are common"""
+    return remove_two_way_vig(american_to_implied_prob(home_ml), american_to_implied_prob(away_ml))
+
+def fair_probs_cache_info():
+    """Hit/miss counts of the vig-removal cache behind fair_probs_from_moneyline"""
+    return _fair_probs.cache_info()
+
 def fair_probs_from_moneyline(home_ml: int, away_ml: int) -> Dict[str, float]:
-    p_h = american_to_implied_prob(home_ml)
-    p_a = american_to_implied_prob(away_ml)
-    p_h_fair, p_a_fair = remove_two_way_vig(p_h, p_a)
+    p_h_fair, p_a_fair = _fair_probs(home_ml, away_ml)
     return {"home": p_h_fair, "away": p_a_fair}
+
+def american_to_implied_prob_batch(odds: np.ndarray) -> np.ndarray:
+    """Vectorized american_to_implied_prob"""
+    odds = np.asarray(odds, dtype=np.float64)
+    return np.where(odds > 0, 100.0 / (np.abs(odds) + 100.0), np.abs(odds) / (np.abs(odds) + 100.0))
+
+def compute_edge_batch(home_ml: np.ndarray, away_ml: np.ndarray, p_home: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vig removal + edge over arrays of games: (fair_home, fair_away, edge_home_pct, edge_away_pct)"""
+    p_h = american_to_implied_prob_batch(home_ml)
+    p_a = american_to_implied_prob_batch(away_ml)
+    p_home = np.asarray(p_home, dtype=np.float64)
+    s = p_h + p_a
+    fair_home = p_h / s
+    fair_away = p_a / s
+    return fair_home, fair_away, (p_home - fair_home) * 100.0, ((1.0 - p_home) - fair_away) * 100.0
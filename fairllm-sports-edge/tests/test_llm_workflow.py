@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from fairllm_agent.agentic_workflow_llm import LLMSportsEdgeFlow
+
+ODDS = {
+    "event_id": "test-001",
+    "sport": "basketball",
+    "league": "NBA",
+    "home_team": "Lakers",
+    "away_team": "Celtics",
+    "sportsbook": "DraftKings",
+    "moneyline": {"home": -150, "away": 130},
+}
+FORECAST = {"event_id": "test-001", "p_model": {"home": 0.65, "away": 0.35}}
+
+
+@pytest.fixture
+def workflow():
+    flow = LLMSportsEdgeFlow()
+    # Keep tests offline: never try to download the model, use rule-based fallbacks
+    for agent in flow.agents:
+        agent._load_model = lambda: None
+    return flow
+
+
+def test_run_async_matches_run(workflow):
+    assert asyncio.run(workflow.run_async(ODDS, FORECAST)) == workflow.run(ODDS, FORECAST)
+
+
+def test_run_batch_skips_bad_games(workflow):
+    bad_odds = {**ODDS, "event_id": "bad", "moneyline": {"home": None, "away": None}}
+    reports = workflow.run_batch([(ODDS, FORECAST), (bad_odds, FORECAST), (ODDS, FORECAST)])
+    assert len(reports) == 2
+    assert reports[0] == workflow.run(ODDS, FORECAST)
+
+
+def test_astream_yields_agent_text_then_report(workflow):
+    async def collect():
+        return [event async for event in workflow.astream(ODDS, FORECAST)]
+
+    events = asyncio.run(collect())
+    assert events[-1][0] == "report"
+    assert events[-1][2] == workflow.run(ODDS, FORECAST)
+
+    streamed = {name for kind, name, _ in events if kind == "text"}
+    done = [name for kind, name, _ in events if kind == "done"]
+    assert streamed == {agent.name for agent in workflow.agents}
+    assert done[-1] == "ReportGenerator"
@@ -1,4 +1,6 @@
-from fairllm_agent.probability_calc import american_to_implied_prob, remove_two_way_vig, fair_probs_from_moneyline
+import numpy as np
+
+from fairllm_agent.probability_calc import american_to_implied_prob, remove_two_way_vig, fair_probs_from_moneyline, fair_probs_cache_info, compute_edge_batch, american_to_implied_prob_batch
 
 def test_american_to_implied_prob():
     assert round(american_to_implied_prob(-110), 4) == 0.5238
@@ -11,3 +13,27 @@ def test_remove_two_way_vig():
 def test_fair_probs_from_moneyline():
     p = fair_probs_from_moneyline(-110, +105)
     assert round(p["home"] + p["away"], 6) == 1.000000
+
+def test_fair_probs_cache_info_counts_repeats():
+    fair_probs_from_moneyline(-135, +115)
+    hits = fair_probs_cache_info().hits
+    fair_probs_from_moneyline(-135, +115)
+    assert fair_probs_cache_info().hits == hits + 1
+
+def test_compute_edge_batch():
+    home_ml = np.array([-150, -110, 120])
+    away_ml = np.array([130, -110, -140])
+    p_home = np.array([0.65, 0.5, 0.45])
+    fair_home, fair_away, edge_home, edge_away = compute_edge_batch(home_ml, away_ml, p_home)
+    for i in range(3):
+        p = fair_probs_from_moneyline(int(home_ml[i]), int(away_ml[i]))
+        assert round(fair_home[i], 6) == round(p["home"], 6)
+        assert round(fair_away[i], 6) == round(p["away"], 6)
+        assert round(edge_home[i], 6) == round((p_home[i] - p["home"]) * 100, 6)
+        assert round(edge_away[i], 6) == round((1 - p_home[i] - p["away"]) * 100, 6)
+
+def test_american_to_implied_prob_batch():
+    odds = np.array([-110, 105, -10000, 10000, -25000, 30000])
+    probs = american_to_implied_prob_batch(odds)
+    for ml, p in zip(odds, probs):
+        assert round(p, 9) == round(american_to_implied_prob(int(ml)), 9)
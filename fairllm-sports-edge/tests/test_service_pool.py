@@ -0,0 +1,20 @@
+import pytest
+
+from chatbot_conversational import ConversationalChatGUI as Chat
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    workflow = object()
+    monkeypatch.setattr(Chat, "_pool", {"key": [workflow, None, 2, None]})
+    return workflow
+
+
+def test_entry_survives_while_another_window_uses_it(pool):
+    Chat._release_services(pool)  # window A closes; window B still holds it
+    Chat._evict_idle(max_idle=-1)
+    assert "key" in Chat._pool
+
+    Chat._release_services(pool)  # window B closes
+    Chat._evict_idle(max_idle=-1)
+    assert "key" not in Chat._pool
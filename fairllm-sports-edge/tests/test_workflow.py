@@ -0,0 +1,30 @@
+from fairllm_agent.agentic_workflow import SportsEdgeFlow
+
+ODDS = {
+    "event_id": "test-001",
+    "sport": "basketball",
+    "league": "NBA",
+    "home_team": "Lakers",
+    "away_team": "Celtics",
+    "sportsbook": "DraftKings",
+    "moneyline": {"home": -150, "away": 130},
+}
+FORECAST = {"event_id": "test-001", "p_model": {"home": 0.65, "away": 0.35}}
+
+
+def test_run_batch_threads_keep_order_and_skip_bad_games():
+    flow = SportsEdgeFlow()
+    bad_odds = {**ODDS, "event_id": "bad", "moneyline": {"home": None, "away": None}}
+    other_odds = {**ODDS, "home_team": "Heat", "moneyline": {"home": 145, "away": -165}}
+    games = [(ODDS, FORECAST), (bad_odds, FORECAST), (other_odds, FORECAST)]
+
+    sequential = flow.run_batch(games)
+    assert len(sequential) == 2
+    assert flow.run_batch(games, max_workers=4) == sequential
+    assert list(flow.iter_batch(iter(games))) == sequential
+
+
+def test_edge_pct_is_in_percentage_points():
+    report = SportsEdgeFlow().run(ODDS, FORECAST)
+    fair = report["fair_probabilities"]["home"]
+    assert report["edge_analysis"]["edge_pct"]["home"] == round((0.65 - fair) * 100, 2)